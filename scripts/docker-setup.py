@@ -5,38 +5,138 @@ Sets up Docker containers and manages the development environment.
 """
 
 import os
+import shlex
+import shutil
 import sys
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-def run_command(command, description, check=True):
-    """Run a command and handle errors"""
+# Working directory, resolved once at import time
+CWD = Path.cwd()
+
+def run_command(command, description, check=True, shell=False, stream=False):
+    """Run a command and handle errors
+
+    With stream=True output goes straight to the terminal instead of being
+    buffered in memory — use this for long-running commands (builds, logs)
+    where buffering hides progress and can balloon memory.
+    """
     print(f"🔧 {description}...")
+    if isinstance(command, str) and not shell:
+        # Tokenize so we exec the binary directly instead of forking /bin/sh
+        command = shlex.split(command)
     try:
-        result = subprocess.run(command, shell=True, check=check, capture_output=True, text=True)
+        result = subprocess.run(command, shell=shell, check=check, capture_output=not stream, text=True)
         print(f"✅ {description} completed")
-        return result.stdout
+        return result.stdout if not stream else ""
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed: {e}")
         if e.stderr:
             print(f"Error: {e.stderr}")
         return None
 
+def _ping_daemon_socket():
+    """Fast daemon liveness check over the Docker unix socket.
+
+    Returns True/False when the socket gives a definitive answer, or None
+    when the probe doesn't apply (Windows named pipe, remote context) and
+    the caller should fall back to the CLI.
+    """
+    import http.client
+    import socket
+
+    host = os.environ.get("DOCKER_HOST", "unix:///var/run/docker.sock")
+    if not host.startswith("unix://"):
+        return None
+
+    socket_path = host.removeprefix("unix://")
+    if not os.path.exists(socket_path):
+        return False
+
+    class UnixHTTPConnection(http.client.HTTPConnection):
+        def connect(self):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(self.timeout)
+            self.sock.connect(socket_path)
+
+    connection = UnixHTTPConnection("localhost", timeout=2)
+    try:
+        connection.request("GET", "/_ping")
+        return connection.getresponse().status == 200
+    except OSError:
+        return False
+    finally:
+        connection.close()
+
+@lru_cache(maxsize=1)
+def _probe_all():
+    """Run all Docker availability probes concurrently (cached for the process lifetime)"""
+    probes = [
+        ("docker_version", ["docker", "--version"]),
+        # Single round-trip daemon check (fails fast when daemon is down)
+        ("docker_daemon", ["docker", "version", "--format", "{{.Server.Version}}"]),
+        ("compose_v1", ["docker-compose", "--version"]),
+        ("compose_v2", ["docker", "compose", "version"]),
+    ]
+
+    def probe(item):
+        key, cmd = item
+        if key == "docker_daemon":
+            # A /_ping over the unix socket beats spawning the CLI
+            ping = _ping_daemon_socket()
+            if ping is not None:
+                return key, ping
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            return key, result.returncode == 0
+        except OSError:
+            return key, False
+
+    # The probes are I/O-bound on the Docker socket, so overlapping them
+    # collapses wall time from the sum to the slowest single probe
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        return dict(executor.map(probe, probes))
+
+def _probe_docker():
+    """Check Docker CLI and daemon availability from the probe batch"""
+    results = _probe_all()
+    if not results["docker_version"]:
+        return "not-installed"
+    if not results["docker_daemon"]:
+        return "daemon-down"
+    return "ok"
+
+# Compose invocation chosen by _probe_docker_compose(); the Go plugin
+# ("docker compose") starts much faster than the legacy Python wrapper
+COMPOSE = "docker-compose"
+
+def _probe_docker_compose():
+    """Check Docker Compose availability and pick the faster invocation"""
+    global COMPOSE
+    results = _probe_all()
+    if results["compose_v2"]:
+        COMPOSE = "docker compose"
+        return True
+    if results["compose_v1"]:
+        COMPOSE = "docker-compose"
+        return True
+    return False
+
 def check_docker():
     """Check if Docker is installed and running"""
     print("🐳 Checking Docker installation...")
 
-    # Check Docker command
-    result = run_command("docker --version", "Checking Docker version", check=False)
-    if not result:
+    probe = _probe_docker()
+    if probe == "not-installed":
         print("❌ Docker is not installed or not in PATH")
         print("Please install Docker from https://docker.com")
         return False
 
-    # Check Docker daemon
-    result = run_command("docker info", "Checking Docker daemon", check=False)
-    if not result:
+    if probe == "daemon-down":
         print("❌ Docker daemon is not running")
         print("Please start Docker Desktop or Docker service")
         return False
@@ -48,14 +148,10 @@ def check_docker_compose():
     """Check if Docker Compose is installed"""
     print("🔧 Checking Docker Compose...")
 
-    # Check for docker-compose (older versions) or docker compose (newer versions)
-    result = run_command("docker-compose --version", "Checking docker-compose", check=False)
-    if not result:
-        result = run_command("docker compose version", "Checking docker compose", check=False)
-        if not result:
-            print("❌ Docker Compose is not installed")
-            print("Please install Docker Compose from https://docs.docker.com/compose/")
-            return False
+    if not _probe_docker_compose():
+        print("❌ Docker Compose is not installed")
+        print("Please install Docker Compose from https://docs.docker.com/compose/")
+        return False
 
     print("✅ Docker Compose is available")
     return True
@@ -64,13 +160,14 @@ def create_env_file():
     """Create .env file from template if it doesn't exist"""
     print("📝 Setting up environment file...")
 
-    env_file = Path.cwd() / ".env"
-    env_example = Path.cwd() / ".env.example"
+    env_file = CWD / ".env"
+    env_example = CWD / ".env.example"
 
     if not env_file.exists():
         if env_example.exists():
-            import shutil
-            shutil.copy(env_example, env_file)
+            # Deliberately a real copy, not os.link: the user is told to edit
+            # .env next, and a hardlink would write through to .env.example
+            shutil.copyfile(env_example, env_file)
             print("✅ Created .env from .env.example")
             print("⚠️  Please edit .env file with your API keys")
         else:
@@ -86,11 +183,11 @@ def build_images(dev=True):
     print(f"🏗️  Building Docker images ({'development' if dev else 'production'})...")
 
     if dev:
-        command = "docker-compose build"
+        command = f"{COMPOSE} build"
     else:
-        command = "docker-compose -f docker-compose.yml -f docker-compose.prod.yml build"
+        command = f"{COMPOSE} -f docker-compose.yml -f docker-compose.prod.yml build"
 
-    result = run_command(command, "Building Docker images")
+    result = run_command(command, "Building Docker images", stream=True)
     return result is not None
 
 def start_services(dev=True):
@@ -98,69 +195,91 @@ def start_services(dev=True):
     print(f"🚀 Starting Docker services ({'development' if dev else 'production'})...")
 
     if dev:
-        command = "docker-compose up -d"
+        command = f"{COMPOSE} up -d"
     else:
-        command = "docker-compose -f docker-compose.yml -f docker-compose.prod.yml up -d"
+        command = f"{COMPOSE} -f docker-compose.yml -f docker-compose.prod.yml up -d"
 
-    result = run_command(command, "Starting services")
+    result = run_command(command, "Starting services", stream=True)
     return result is not None
 
 def stop_services():
     """Stop Docker services"""
     print("🛑 Stopping Docker services...")
-    result = run_command("docker-compose down", "Stopping services")
+    result = run_command(f"{COMPOSE} down", "Stopping services")
     return result is not None
 
 def show_logs():
     """Show Docker logs"""
     print("📋 Showing Docker logs...")
-    run_command("docker-compose logs -f", "Showing logs", check=False)
+    run_command(f"{COMPOSE} logs -f", "Showing logs", check=False, stream=True)
 
 def show_status():
     """Show Docker service status"""
     print("📊 Docker service status:")
-    run_command("docker-compose ps", "Service status")
+    run_command(f"{COMPOSE} ps", "Service status")
 
 def clean_docker():
     """Clean Docker resources"""
     print("🧹 Cleaning Docker resources...")
 
-    commands = [
-        "docker-compose down -v",
+    # Services must be down before pruning
+    run_command(f"{COMPOSE} down -v", f"Running: {COMPOSE} down -v")
+
+    # The prunes are independent of each other, so run them concurrently
+    prune_commands = [
         "docker system prune -f",
         "docker volume prune -f"
     ]
 
-    for command in commands:
-        run_command(command, f"Running: {command}")
+    with ThreadPoolExecutor(max_workers=min(4, len(prune_commands))) as executor:
+        futures = [
+            executor.submit(run_command, command, f"Running: {command}", stream=True)
+            for command in prune_commands
+        ]
+        for future in futures:
+            future.result()
 
 def backup_data():
     """Backup Docker volumes"""
     print("💾 Backing up Docker volumes...")
 
     # Create backup directory
-    backup_dir = Path.cwd() / "backups" / "docker"
+    backup_dir = CWD / "backups" / "docker"
     backup_dir.mkdir(parents=True, exist_ok=True)
 
-    # Backup PostgreSQL
-    run_command(
-        f"docker-compose exec -T postgres pg_dump -U appuser builder_team > {backup_dir}/postgres_$(date +%Y%m%d_%H%M%S).sql",
-        "Backing up PostgreSQL"
-    )
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    postgres_backup = backup_dir / f"postgres_{timestamp}.sql"
+
+    def backup_postgres():
+        # Redirect pg_dump straight into the backup file; no shell needed
+        print("🔧 Backing up PostgreSQL...")
+        with postgres_backup.open('wb') as out:
+            result = subprocess.run(
+                [*shlex.split(COMPOSE), "exec", "-T", "postgres", "pg_dump", "-U", "appuser", "builder_team"],
+                stdout=out
+            )
+        if result.returncode == 0:
+            print("✅ Backing up PostgreSQL completed")
+        else:
+            print("❌ Backing up PostgreSQL failed")
 
-    # Backup Redis
-    run_command(
-        f"docker-compose exec -T redis redis-cli BGSAVE",
-        "Triggering Redis backup"
-    )
+    # PostgreSQL dump and Redis BGSAVE are independent, so run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(backup_postgres),
+            executor.submit(run_command, f"{COMPOSE} exec -T redis redis-cli BGSAVE", "Triggering Redis backup")
+        ]
+        for future in futures:
+            future.result()
 
 def restore_data(backup_file):
     """Restore Docker volumes from backup"""
     print(f"🔄 Restoring from backup: {backup_file}")
 
     result = run_command(
-        f"docker-compose exec -T postgres psql -U appuser -d builder_team < {backup_file}",
-        "Restoring PostgreSQL"
+        f"{COMPOSE} exec -T postgres psql -U appuser -d builder_team < {backup_file}",
+        "Restoring PostgreSQL",
+        shell=True
     )
 
     return result is not None
@@ -168,17 +287,17 @@ def restore_data(backup_file):
 def shell_service(service_name):
     """Open shell in a service container"""
     print(f"🐚 Opening shell in {service_name}...")
-    run_command(f"docker-compose exec {service_name} /bin/bash", f"Shell in {service_name}", check=False)
+    run_command(f"{COMPOSE} exec {service_name} /bin/bash", f"Shell in {service_name}", check=False)
 
 def run_tests():
     """Run tests in Docker container"""
     print("🧪 Running tests in Docker...")
 
     # Build test image
-    run_command("docker build --target testing -t builder-team-test .", "Building test image")
+    run_command("docker build --target testing -t builder-team-test .", "Building test image", stream=True)
 
     # Run tests
-    result = run_command("docker run --rm builder-team-test", "Running tests")
+    result = run_command("docker run --rm builder-team-test", "Running tests", stream=True)
     return result is not None
 
 def main():
@@ -194,8 +313,10 @@ def main():
 
     args = parser.parse_args()
 
-    print("🐳 AI Crew Builder Team - Docker Setup")
-    print("=" * 40)
+    print("🐳 AI Crew Builder Team - Docker Setup\n" + "=" * 40)
+
+    # Run all availability probes once, in parallel
+    _probe_all()
 
     # Check Docker prerequisites
     if not check_docker() or not check_docker_compose():
@@ -211,12 +332,14 @@ def main():
     if args.command == "setup":
         success = build_images(dev) and start_services(dev)
         if success:
-            print("\n🎉 Docker setup completed successfully!")
-            print("\n📋 Next steps:")
-            print("1. Edit your .env file with API keys")
-            print("2. Check service status: python scripts/docker-setup.py status")
-            print("3. View logs: python scripts/docker-setup.py logs")
-            print("4. Access the application at http://localhost:8000")
+            print("""
+🎉 Docker setup completed successfully!
+
+📋 Next steps:
+1. Edit your .env file with API keys
+2. Check service status: python scripts/docker-setup.py status
+3. View logs: python scripts/docker-setup.py logs
+4. Access the application at http://localhost:8000""")
 
     elif args.command == "build":
         build_images(dev)
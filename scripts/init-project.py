@@ -4,46 +4,170 @@ AI Crew Project Builder - Initialization Script
 This script helps define and initialize a new AI crew project using the builder team approach.
 """
 
+import argparse
 import os
 import sys
-import json
-from datetime import datetime
 from pathlib import Path
 
+# Commented skeleton used for the single $EDITOR definition session
+PROJECT_TEMPLATE = """\
+# AI Crew Project Definition
+# Fill in the fields below, then save and close your editor to continue.
+name: ""                     # Project name (required)
+description: ""
+owner: ""
+timeline: ""                 # e.g. 4-6 weeks
+goal: ""
+target_crew_description: ""  # Describe the AI crew you want to build (required)
+key_features: []
+success_metrics: []
+target_agents: []
+# target_agents:
+#   - name: ""
+#     role: ""
+#     mbti_type: "Not specified"
+#     responsibilities: []
+frontend_framework: "None"
+backend_framework: ""
+database_type: ""
+api_type: ""
+hosting_platform: ""
+openai_model: "gpt-4-turbo-preview"
+monthly_budget: 100.0
+"""
+
+def _finalize_project(project):
+    """Fill defaults and metadata on a loaded project definition."""
+    from datetime import datetime
+
+    defaults = {
+        'name': '',
+        'description': '',
+        'owner': '',
+        'timeline': '',
+        'goal': '',
+        'target_crew_description': '',
+        'key_features': [],
+        'success_metrics': [],
+        'target_agents': [],
+        'frontend_framework': 'None',
+        'backend_framework': '',
+        'database_type': '',
+        'api_type': '',
+        'hosting_platform': '',
+        'openai_model': 'gpt-4-turbo-preview',
+        'monthly_budget': 100.0
+    }
+    for key, value in defaults.items():
+        project.setdefault(key, value)
+
+    project['monthly_budget'] = float(project['monthly_budget'])
+    for agent in project['target_agents']:
+        agent.setdefault('mbti_type', 'Not specified')
+        agent.setdefault('responsibilities', [])
+
+    project['created_date'] = datetime.now().strftime("%Y-%m-%d")
+    project['status'] = "initialized"
+    return project
+
+def load_project_definition(definition_file):
+    """Load a project definition from a YAML (or JSON) file."""
+    import yaml
+
+    with open(definition_file) as f:
+        project = yaml.safe_load(f)
+
+    if not isinstance(project, dict):
+        print(f"❌ Invalid project definition file: {definition_file}")
+        sys.exit(1)
+
+    return _finalize_project(project)
+
+def load_project_config(config_file):
+    """Load a project definition from JSON with no interactive I/O at all.
+
+    Expected schema (all other keys are optional and defaulted):
+    {
+        "name": "...",                     # required
+        "target_crew_description": "...",  # required
+        "description": "...", "owner": "...", "timeline": "...", "goal": "...",
+        "key_features": ["..."], "success_metrics": ["..."],
+        "target_agents": [{"name": "...", "role": "...",
+                           "mbti_type": "...", "responsibilities": ["..."]}],
+        "frontend_framework": "...", "backend_framework": "...",
+        "database_type": "...", "api_type": "...", "hosting_platform": "...",
+        "openai_model": "gpt-4-turbo-preview", "monthly_budget": 100.0
+    }
+    """
+    import json
+
+    with open(config_file) as f:
+        project = json.load(f)
+
+    missing = [key for key in ('name', 'target_crew_description') if not project.get(key)]
+    if missing:
+        print(f"❌ Missing required keys in {config_file}: {', '.join(missing)}")
+        sys.exit(1)
+
+    return _finalize_project(project)
+
+def get_project_definition_from_editor():
+    """Collect the full project definition in a single $EDITOR session.
+
+    Writes a commented YAML skeleton to a temp file, opens the user's editor
+    once, and parses the result — one round trip instead of a dozen prompts.
+    """
+    import subprocess
+    import tempfile
+    import yaml
+
+    editor = os.environ.get('EDITOR', 'vi')
+
+    with tempfile.NamedTemporaryFile('w', suffix='.yaml', delete=False) as f:
+        f.write(PROJECT_TEMPLATE)
+        temp_path = f.name
+
+    try:
+        subprocess.run([editor, temp_path], check=True)
+        with open(temp_path) as f:
+            project = yaml.safe_load(f)
+    finally:
+        os.unlink(temp_path)
+
+    if not isinstance(project, dict):
+        print("❌ Project definition is empty or malformed")
+        sys.exit(1)
+
+    return _finalize_project(project)
+
 def get_project_definition():
     """Interactive project definition session"""
-    print("🚀 AI Crew Project Builder - Initialization")
-    print("=" * 50)
-    print("This script will help you define the AI crew project you want to build.")
-    print("Our builder team will then construct it using OpenSpec-driven development.\n")
+    print("🚀 AI Crew Project Builder - Initialization\n" + "=" * 50 + "\n"
+          "This script will help you define the AI crew project you want to build.\n"
+          "Our builder team will then construct it using OpenSpec-driven development.\n")
 
     project = {}
 
     # Basic Project Information
-    print("📋 PROJECT BASIC INFORMATION")
-    print("-" * 30)
+    print("📋 PROJECT BASIC INFORMATION\n" + "-" * 30)
     project['name'] = input("Project name: ").strip()
     project['description'] = input("Project description: ").strip()
     project['owner'] = input("Project owner: ").strip()
     project['timeline'] = input("Estimated timeline (e.g., 4-6 weeks): ").strip()
 
     # Project Goal
-    print("\n🎯 PROJECT GOAL")
-    print("-" * 20)
-    print("What is the main goal of this AI crew?")
+    print("\n🎯 PROJECT GOAL\n" + "-" * 20 + "\nWhat is the main goal of this AI crew?")
     project['goal'] = input("> ").strip()
 
     # Target AI Crew Description
-    print("\n🤖 TARGET AI CREW")
-    print("-" * 25)
-    print("Describe the AI crew you want to build:")
-    print("(e.g., 'A content creation crew that writes blog posts and creates social media')")
+    print("\n🤖 TARGET AI CREW\n" + "-" * 25 + "\n"
+          "Describe the AI crew you want to build:\n"
+          "(e.g., 'A content creation crew that writes blog posts and creates social media')")
     project['target_crew_description'] = input("> ").strip()
 
     # Key Features
-    print("\n✨ KEY FEATURES")
-    print("-" * 20)
-    print("List the key features (one per line, empty line to finish):")
+    print("\n✨ KEY FEATURES\n" + "-" * 20 + "\n"
+          "List the key features (one per line, empty line to finish):")
     features = []
     while True:
         feature = input(f"Feature {len(features) + 1}: ").strip()
@@ -53,9 +177,8 @@ def get_project_definition():
     project['key_features'] = features
 
     # Success Metrics
-    print("\n📊 SUCCESS METRICS")
-    print("-" * 22)
-    print("How will you measure success? (one per line, empty line to finish):")
+    print("\n📊 SUCCESS METRICS\n" + "-" * 22 + "\n"
+          "How will you measure success? (one per line, empty line to finish):")
     metrics = []
     while True:
         metric = input(f"Metric {len(metrics) + 1}: ").strip()
@@ -65,9 +188,7 @@ def get_project_definition():
     project['success_metrics'] = metrics
 
     # AI Crew Agents
-    print("\n👥 AI CREW AGENTS")
-    print("-" * 22)
-    print("Define the agents in your target AI crew:")
+    print("\n👥 AI CREW AGENTS\n" + "-" * 22 + "\nDefine the agents in your target AI crew:")
     agents = []
     agent_count = 0
 
@@ -99,8 +220,7 @@ def get_project_definition():
     project['target_agents'] = agents
 
     # Technical Requirements
-    print("\n⚙️ TECHNICAL REQUIREMENTS")
-    print("-" * 30)
+    print("\n⚙️ TECHNICAL REQUIREMENTS\n" + "-" * 30)
 
     print("Frontend framework (if any):")
     project['frontend_framework'] = input("> ").strip() or "None"
@@ -118,15 +238,13 @@ def get_project_definition():
     project['hosting_platform'] = input("> ").strip()
 
     # AI Provider Configuration
-    print("\n🤖 AI PROVIDER CONFIGURATION")
-    print("-" * 30)
-    print("Your project crew will use OpenAI by default.")
-    print("The builder team uses Claude + ZhipuAI for project development.")
-
-    print("\nOpenAI model for your project crew:")
-    print("1. gpt-4-turbo-preview (Recommended, best capabilities)")
-    print("2. gpt-4 (Capable, higher cost)")
-    print("3. gpt-3.5-turbo (Fast, cost-effective)")
+    print("\n🤖 AI PROVIDER CONFIGURATION\n" + "-" * 30 + "\n"
+          "Your project crew will use OpenAI by default.\n"
+          "The builder team uses Claude + ZhipuAI for project development.\n\n"
+          "OpenAI model for your project crew:\n"
+          "1. gpt-4-turbo-preview (Recommended, best capabilities)\n"
+          "2. gpt-4 (Capable, higher cost)\n"
+          "3. gpt-3.5-turbo (Fast, cost-effective)")
 
     model_choice = input("Choose model (1-3, default=1): ").strip()
     model_map = {
@@ -143,6 +261,7 @@ def get_project_definition():
     project['monthly_budget'] = float(budget) if budget else 100.0
 
     # Project Metadata
+    from datetime import datetime
     project['created_date'] = datetime.now().strftime("%Y-%m-%d")
     project['status'] = "initialized"
 
@@ -181,13 +300,35 @@ def create_project_structure(project):
         '.github/workflows'
     ]
 
-    for directory in directories:
-        (project_dir / directory).mkdir(parents=True, exist_ok=True)
+    # Create each unique path component exactly once, parents before
+    # children, instead of re-stat'ing shared prefixes for every entry
+    os.makedirs(project_dir, exist_ok=True)
+    paths = {Path(directory) for directory in directories}
+    paths |= {parent for path in paths for parent in path.parents if parent != Path('.')}
+    for relative in sorted(paths, key=lambda p: len(p.parts)):
+        try:
+            os.mkdir(project_dir / relative)
+        except FileExistsError:
+            pass
 
     return project_dir
 
+def _write_file(path, content):
+    """Write a single text file."""
+    with open(path, 'w') as f:
+        f.write(content)
+
 def create_project_files(project, project_dir):
     """Create initial project files"""
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Rendered contents, written concurrently at the end
+    files = {}
+
+    # Derived values used in several rendered files below
+    daily_budget = project['monthly_budget'] / 30
+    max_agents = min(5, len(project['target_agents']))
 
     # Create project configuration
     config = {
@@ -221,148 +362,136 @@ def create_project_files(project, project_dir):
         }
     }
 
-    with open(project_dir / 'config' / 'project.json', 'w') as f:
-        json.dump(config, f, indent=2)
+    try:
+        import orjson
+        files[project_dir / 'config' / 'project.json'] = orjson.dumps(
+            config, option=orjson.OPT_INDENT_2
+        ).decode()
+    except ImportError:
+        files[project_dir / 'config' / 'project.json'] = json.dumps(config, indent=2)
 
     # Create project-specific crew configuration
-    crew_config_content = f"""# {project['name']} Crew Configuration
-# Generated by AI Crew Builder Team Template
-
-project:
-  name: "{project['name']}"
-  description: "{project['description']}"
-  version: "1.0.0"
-  created: "{project['created_date']}"
-
-# AI Provider Configuration
-provider:
-  name: "openai"
-  type: "openai"
-  model: "{project['openai_model']}"
-  description: "Primary AI provider for {project['name']} crew execution"
-
-  # Rate limiting and cost management
-  limits:
-    requests_per_minute: 350
-    tokens_per_minute: 200_000
-    daily_cost_limit: {project['monthly_budget'] / 30:.2f}
-    monthly_cost_limit: {project['monthly_budget']}
-
-# Crew Configuration
-crew:
-  name: "{project['name']}Crew"
-  description: "{project['description']}"
-
-  # Agent Definitions
-  agents:"""
-
-    # Add agents to the configuration
-    for i, agent in enumerate(project['target_agents']):
-        agent_config = f"""
-
-    {agent['name'].lower().replace(' ', '_')}:
-      name: "{agent['name']}"
-      role: "{agent['role']}"
-      goal: "Execute {agent['role'].lower()} tasks for {project['name']}"
-      backstory: "You are {agent['name']}, a specialized {agent['role']} AI agent working on the {project['name']} project."
-      provider: "openai"
-      model: "{project['openai_model']}"
-
-      # Agent-specific tools (customize as needed)
-      tools:
-        - "file_operations"
-        - "web_search"
-        - "data_analysis"
-
-      # Agent configuration
-      allow_delegation: true
-      verbose: true
-      max_iter: 10
-      memory: true
-
-      # Agent responsibilities
-      responsibilities:"""
-
-        for resp in agent['responsibilities']:
-            agent_config += f"\n        - \"{resp}\""
-
-        crew_config_content += agent_config
-
-    crew_config_content += """
-
-# Workflow Configuration
-workflows:
-  standard_execution:
-    description: "Standard workflow for most project tasks"
-    steps:
-      - "Task analysis and planning"
-      - "Agent coordination and task assignment"
-      - "Individual agent execution"
-      - "Result integration and validation"
-      - "Documentation and reporting"
-
-# Tools Configuration
-tools:
-  file_operations:
-    enabled: true
-    permissions: ["read", "write", "create", "delete"]
-
-  web_search:
-    enabled: true
-    provider: "openai"
-    max_results: 10
-
-# Integration Configuration
-integrations:
-  openspec:
-    enabled: true
-    auto_sync: true
-    change_tracking: true
-
-  git:
-    enabled: true
-    auto_commit: false
-    branch_strategy: "feature-branches"
-
-# Quality Assurance
-quality_assurance:
-  testing:
-    automated_tests: true
-    coverage_target: 80
-
-  review:
-    automated_review: true
-    security_scan: true
-
-# Cost Management
-cost_management:
-  budget:
-    daily_limit: """ + str(project['monthly_budget'] / 30) + f"""
-    monthly_limit: {project['monthly_budget']}
-
-  optimization:
-    smart_routing: true
-    caching: true
-
-# Performance Settings
-performance:
-  parallel_processing:
-    enabled: true
-    max_concurrent_agents: """ + str(min(5, len(project['target_agents']))) + """
-
-  resource_management:
-    memory_limit: "4GB"
-    timeout: 300
-
-# Development Settings
-development:
-  debug_mode: false
-  verbose_logging: true
-  auto_save: true
-"""
+    import yaml
+
+    crew_config = {
+        'project': {
+            'name': project['name'],
+            'description': project['description'],
+            'version': '1.0.0',
+            'created': project['created_date']
+        },
+        'provider': {
+            'name': 'openai',
+            'type': 'openai',
+            'model': project['openai_model'],
+            'description': f"Primary AI provider for {project['name']} crew execution",
+            # Rate limiting and cost management
+            'limits': {
+                'requests_per_minute': 350,
+                'tokens_per_minute': 200000,
+                'daily_cost_limit': round(daily_budget, 2),
+                'monthly_cost_limit': project['monthly_budget']
+            }
+        },
+        'crew': {
+            'name': f"{project['name']}Crew",
+            'description': project['description'],
+            'agents': {
+                agent['name'].lower().replace(' ', '_'): {
+                    'name': agent['name'],
+                    'role': agent['role'],
+                    'goal': f"Execute {agent['role'].lower()} tasks for {project['name']}",
+                    'backstory': f"You are {agent['name']}, a specialized {agent['role']} AI agent working on the {project['name']} project.",
+                    'provider': 'openai',
+                    'model': project['openai_model'],
+                    # Agent-specific tools (customize as needed)
+                    'tools': ['file_operations', 'web_search', 'data_analysis'],
+                    'allow_delegation': True,
+                    'verbose': True,
+                    'max_iter': 10,
+                    'memory': True,
+                    'responsibilities': list(agent['responsibilities'])
+                }
+                for agent in project['target_agents']
+            }
+        },
+        'workflows': {
+            'standard_execution': {
+                'description': 'Standard workflow for most project tasks',
+                'steps': [
+                    'Task analysis and planning',
+                    'Agent coordination and task assignment',
+                    'Individual agent execution',
+                    'Result integration and validation',
+                    'Documentation and reporting'
+                ]
+            }
+        },
+        'tools': {
+            'file_operations': {
+                'enabled': True,
+                'permissions': ['read', 'write', 'create', 'delete']
+            },
+            'web_search': {
+                'enabled': True,
+                'provider': 'openai',
+                'max_results': 10
+            }
+        },
+        'integrations': {
+            'openspec': {
+                'enabled': True,
+                'auto_sync': True,
+                'change_tracking': True
+            },
+            'git': {
+                'enabled': True,
+                'auto_commit': False,
+                'branch_strategy': 'feature-branches'
+            }
+        },
+        'quality_assurance': {
+            'testing': {
+                'automated_tests': True,
+                'coverage_target': 80
+            },
+            'review': {
+                'automated_review': True,
+                'security_scan': True
+            }
+        },
+        'cost_management': {
+            'budget': {
+                'daily_limit': daily_budget,
+                'monthly_limit': project['monthly_budget']
+            },
+            'optimization': {
+                'smart_routing': True,
+                'caching': True
+            }
+        },
+        'performance': {
+            'parallel_processing': {
+                'enabled': True,
+                'max_concurrent_agents': max_agents
+            },
+            'resource_management': {
+                'memory_limit': '4GB',
+                'timeout': 300
+            }
+        },
+        'development': {
+            'debug_mode': False,
+            'verbose_logging': True,
+            'auto_save': True
+        }
+    }
 
-    with open(project_dir / 'config' / 'crew-config.yaml', 'w') as f:
-        f.write(crew_config_content)
+    files[project_dir / 'config' / 'crew-config.yaml'] = (
+        f"# {project['name']} Crew Configuration\n"
+        "# Generated by AI Crew Builder Team Template\n\n"
+        + yaml.safe_dump(crew_config, sort_keys=False, default_flow_style=False)
+    )
 
     # Create environment file template
     env_content = f"""# {project['name']} Environment Variables
@@ -390,15 +519,22 @@ LOG_FILE=logs/project.log
 
 # Cost Management
 MONTHLY_BUDGET={project['monthly_budget']}
-DAILY_BUDGET={project['monthly_budget'] / 30:.2f}
+DAILY_BUDGET={daily_budget:.2f}
 
 # Performance Settings
-MAX_CONCURRENT_AGENTS={min(5, len(project['target_agents']))}
+MAX_CONCURRENT_AGENTS={max_agents}
 AGENT_TIMEOUT=300
 """
 
-    with open(project_dir / '.env.example', 'w') as f:
-        f.write(env_content)
+    files[project_dir / '.env.example'] = env_content
+
+    # Pre-render the repeated list sections: append lines into flat lists
+    # and join once, instead of nesting joins inside f-string expressions
+    team_lines = [f"- **{agent['name']}** - {agent['role']}" for agent in project['target_agents']]
+    application_team = "\n".join(team_lines)
+
+    metric_lines = [f"- {metric}" for metric in project['success_metrics']]
+    metrics_list = "\n".join(metric_lines)
 
     # Create main README
     readme_content = f"""# {project['name']}
@@ -425,7 +561,7 @@ This project is being built using the AI Crew Builder Team approach with OpenSpe
 - **DevOps Specialist (ISTP)** - Infrastructure and deployment
 
 ### Application Team
-{chr(10).join([f"- **{agent['name']}** - {agent['role']}" for agent in project['target_agents']])}
+{application_team}
 
 ## Getting Started
 
@@ -442,17 +578,32 @@ This project is being built using the AI Crew Builder Team approach with OpenSpe
 
 ## Success Metrics
 
-{chr(10).join([f"- {metric}" for metric in project['success_metrics']])}
+{metrics_list}
 
 ---
 
 *Built with AI Crew Builder Team framework*
 """
 
-    with open(project_dir / 'README.md', 'w') as f:
-        f.write(readme_content)
+    files[project_dir / 'README.md'] = readme_content
 
     # Create OpenSpec project specification
+    agent_lines = []
+    for i, agent in enumerate(project['target_agents']):
+        agent_lines.append(f"#### {i+1}. {agent['name']} ({agent['role']})")
+        agent_lines.append(f"**MBTI Type:** {agent['mbti_type']}")
+        agent_lines.append(f"**Core Function:** {agent['role']}")
+        agent_lines.append("**Key Responsibilities:**")
+        agent_lines.extend(f"- {resp}" for resp in agent['responsibilities'])
+    agents_section = "\n".join(agent_lines)
+
+    features_numbered = "\n".join(
+        f"{i+1}. {feature}" for i, feature in enumerate(project['key_features'])
+    )
+    metrics_numbered = "\n".join(
+        f"{i+1}. {metric}" for i, metric in enumerate(project['success_metrics'])
+    )
+
     spec_content = f"""# {project['name']} - Project Specification
 
 **Document Version:** 0.1.0
@@ -477,7 +628,7 @@ This project is being built using the AI Crew Builder Team approach with OpenSpe
 ## Target AI Crew Configuration
 
 ### Agents ({len(project['target_agents'])})
-{chr(10).join([f"#### {i+1}. {agent['name']} ({agent['role']})\n**MBTI Type:** {agent['mbti_type']}\n**Core Function:** {agent['role']}\n**Key Responsibilities:**\n" + chr(10).join([f"- {resp}" for resp in agent['responsibilities']]) for i, agent in enumerate(project['target_agents'])])}
+{agents_section}
 
 ---
 
@@ -493,13 +644,13 @@ This project is being built using the AI Crew Builder Team approach with OpenSpe
 
 ## Key Features
 
-{chr(10).join([f"{i+1}. {feature}" for i, feature in enumerate(project['key_features'])])}
+{features_numbered}
 
 ---
 
 ## Success Metrics
 
-{chr(10).join([f"{i+1}. {metric}" for i, metric in enumerate(project['success_metrics'])])}
+{metrics_numbered}
 
 ---
 
@@ -516,12 +667,21 @@ This project is being built using the AI Crew Builder Team approach with OpenSpe
 *This specification will be updated iteratively throughout the development process.*
 """
 
-    with open(project_dir / 'openspec' / 'specs' / 'system' / 'project-overview.md', 'w') as f:
-        f.write(spec_content)
+    files[project_dir / 'openspec' / 'specs' / 'system' / 'project-overview.md'] = spec_content
+
+    # All contents are rendered; overlap the small-file writes so per-open
+    # latency on slow filesystems is hidden
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(_write_file, path, content)
+            for path, content in files.items()
+        ]
+        for future in futures:
+            future.result()
 
 def create_git_repo(project_dir):
     """Initialize git repository"""
-    os.chdir(project_dir)
+    import subprocess
 
     # Create .gitignore
     gitignore_content = """# Python
@@ -565,21 +725,41 @@ tmp/
 temp/
 """
 
-    with open('.gitignore', 'w') as f:
+    with open(project_dir / '.gitignore', 'w') as f:
         f.write(gitignore_content)
 
-    # Initialize git
-    os.system('git init')
-    os.system('git add .')
-    os.system(f'git commit -m "Initial commit: {project_dir.name} project initialized"')
+    # Initialize git without spawning shells or mutating our own cwd
+    git_commands = [
+        ["git", "init", "-q"],
+        ["git", "add", "."],
+        ["git", "commit", "-q", "-m", f"Initial commit: {project_dir.name} project initialized"]
+    ]
+    for command in git_commands:
+        subprocess.run(command, cwd=project_dir, check=True, stdout=subprocess.DEVNULL)
 
     print("✅ Git repository initialized")
 
 def main():
     """Main initialization process"""
+    parser = argparse.ArgumentParser(description="AI Crew Project Builder - Initialization")
+    parser.add_argument("--config",
+                        help="Load the project definition from a JSON file (CI fast path, no prompts)")
+    parser.add_argument("--from-file",
+                        help="Load the project definition from a YAML/JSON file instead of prompting")
+    parser.add_argument("--no-editor", action="store_true",
+                        help="Use sequential prompts instead of a single $EDITOR session")
+    args = parser.parse_args()
+
     try:
         # Get project definition
-        project = get_project_definition()
+        if args.config:
+            project = load_project_config(args.config)
+        elif args.from_file:
+            project = load_project_definition(args.from_file)
+        elif not args.no_editor and sys.stdin.isatty():
+            project = get_project_definition_from_editor()
+        else:
+            project = get_project_definition()
 
         # Validate project definition
         if not project['name'] or not project['target_crew_description']:
@@ -5,149 +5,378 @@ Sets up both local and Docker environments for the AI Crew Builder Team.
 """
 
 import os
+import shlex
 import sys
-import subprocess
-import platform
 import argparse
+import functools
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Stage output is buffered here and written in one syscall per stage;
+# per-line writes are expensive on line-buffered CI pipes. The lock keeps
+# concurrent stage flushes from emitting the same buffer twice.
+_log = io.StringIO()
+_log_lock = threading.Lock()
+
+def log(message):
+    """Buffer one output line until the enclosing stage flushes."""
+    with _log_lock:
+        _log.write(f"{message}\n")
+
+def flush_log():
+    """Write everything buffered so far in a single stdout write."""
+    with _log_lock:
+        sys.stdout.write(_log.getvalue())
+        sys.stdout.flush()
+        _log.truncate(0)
+        _log.seek(0)
+
+def staged(func):
+    """Flush the buffered log once when the stage finishes (or fails)."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            flush_log()
+    return wrapper
+
 def run_command(command, description, check=True):
     """Run a command and handle errors"""
-    print(f"🔧 {description}...")
+    # Deferred: most runs (--help, cached venv, no Docker) never spawn
+    # anything, so don't pay subprocess's import cost at startup
+    import subprocess
+
+    log(f"🔧 {description}...")
+    if isinstance(command, str):
+        # Tokenize so we exec the binary directly instead of forking /bin/sh
+        command = shlex.split(command)
     try:
-        result = subprocess.run(command, shell=True, check=check, capture_output=True, text=True)
-        print(f"✅ {description} completed")
+        result = subprocess.run(command, check=check, capture_output=True, text=True)
+        log(f"✅ {description} completed")
         return result.stdout
     except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed: {e}")
+        log(f"❌ {description} failed: {e}")
         if e.stderr:
-            print(f"Error output: {e.stderr}")
+            log(f"Error output: {e.stderr}")
         return None
 
+@staged
 def check_python_version():
     """Check if Python version is compatible"""
-    print("🐍 Checking Python version...")
+    log("🐍 Checking Python version...")
     version = sys.version_info
     if version.major < 3 or (version.major == 3 and version.minor < 10):
-        print("❌ Python 3.10 or higher is required")
-        print(f"Current version: {version.major}.{version.minor}.{version.micro}")
+        log("❌ Python 3.10 or higher is required")
+        log(f"Current version: {version.major}.{version.minor}.{version.micro}")
         sys.exit(1)
-    print(f"✅ Python {version.major}.{version.minor}.{version.micro} is compatible")
+    log(f"✅ Python {version.major}.{version.minor}.{version.micro} is compatible")
+
+def _venv_cache_dir(root):
+    """Cache location keyed on the dependency set and interpreter version."""
+    import hashlib
+
+    digest = hashlib.sha256()
+    requirements = root / "requirements.txt"
+    if requirements.exists():
+        digest.update(requirements.read_bytes())
+    digest.update(f"{sys.version_info.major}.{sys.version_info.minor}".encode())
+    return Path.home() / ".cache" / "buildercrew" / f"venv-{digest.hexdigest()[:16]}"
+
+def _fix_venv_paths(venv_path):
+    """Rewrite hard-coded interpreter paths after relocating a venv."""
+    bin_dir = venv_path / ("Scripts" if os.name == "nt" else "bin")
+    shebang = f"#!{bin_dir / 'python'}".encode()
+    for script in bin_dir.iterdir():
+        if script.is_symlink() or not script.is_file():
+            continue
+        try:
+            data = script.read_bytes()
+        except OSError:
+            continue
+        if data.startswith(b"#!") and b"python" in data.split(b"\n", 1)[0]:
+            _, _, body = data.partition(b"\n")
+            script.write_bytes(shebang + b"\n" + body)
+
+def restore_cached_venv(root, venv_path):
+    """Restore a previously provisioned venv matching requirements.txt."""
+    import shutil
+
+    cache_dir = _venv_cache_dir(root)
+    if not cache_dir.exists():
+        return False
+
+    log("♻️  Restoring virtual environment from cache...")
+    shutil.copytree(cache_dir, venv_path, symlinks=True)
+    _fix_venv_paths(venv_path)
+    log("✅ Virtual environment restored from cache")
+    return True
+
+def save_venv_cache(root, venv_path):
+    """Copy a freshly provisioned venv into the cache for future runs."""
+    import shutil
 
-def create_virtual_environment():
+    cache_dir = _venv_cache_dir(root)
+    if cache_dir.exists() or not venv_path.exists():
+        return
+
+    log("💾 Caching virtual environment for future runs...")
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copytree(venv_path, cache_dir, symlinks=True)
+
+@staged
+def create_virtual_environment(root, force=False):
     """Create virtual environment"""
-    print("\n📦 Creating virtual environment...")
-    venv_path = Path.cwd() / ".venv"
+    log("\n📦 Creating virtual environment...")
+    venv_path = root / ".venv"
 
     if venv_path.exists():
-        print("⚠️  Virtual environment already exists")
-        response = input("Recreate it? (y/N): ").strip().lower()
+        log("⚠️  Virtual environment already exists")
+        if force:
+            response = 'y'
+        elif not sys.stdin.isatty():
+            # CI / piped runs can't answer the prompt — keep the venv
+            # rather than blocking forever
+            response = 'n'
+        else:
+            flush_log()
+            response = input("Recreate it? (y/N): ").strip().lower()
         if response != 'y':
-            print("✅ Using existing virtual environment")
-            return
-        print("🗑️  Removing existing virtual environment...")
-        run_command(f"rm -rf {venv_path}", "Removing virtual environment")
-
-    # Create virtual environment
-    success = run_command(f'python{sys.version_info.major}.{sys.version_info.minor} -m venv .venv', "Creating virtual environment")
-    if not success:
-        print("❌ Failed to create virtual environment")
+            log("✅ Using existing virtual environment")
+            return "existing"
+        log("🗑️  Removing existing virtual environment...")
+        import shutil
+        if os.name == "posix":
+            # Rename is instant; unlinking thousands of site-packages files
+            # is not. Move the old venv aside and let a background thread
+            # reclaim it while the new venv is being built.
+            backup = venv_path.with_name(".venv.old")
+            if backup.exists():
+                shutil.rmtree(backup)
+            venv_path.rename(backup)
+            threading.Thread(target=shutil.rmtree, args=(backup,), daemon=True).start()
+        else:
+            # Windows rename semantics make the rename-then-delete trick
+            # unreliable; delete in place
+            shutil.rmtree(venv_path)
+
+    # A cached venv for this requirements.txt + Python version skips both
+    # the venv build and the wheel installs
+    if restore_cached_venv(root, venv_path):
+        return "cached"
+
+    # Create the venv in-process with the already-running interpreter:
+    # no PATH lookup, no shell, no extra Python startup. Symlinks are
+    # faster than copying the interpreter on POSIX.
+    import venv
+    try:
+        venv.EnvBuilder(with_pip=True, symlinks=(os.name == "posix")).create(venv_path)
+        log("✅ Virtual environment created")
+    except Exception as e:
+        log(f"❌ Failed to create virtual environment: {e}")
         sys.exit(1)
 
-def install_dependencies():
+    return "created"
+
+@staged
+def install_dependencies(fresh_venv=False):
     """Install Python dependencies"""
-    print("\n📚 Installing Python dependencies...")
+    import shutil
+
+    log("\n📚 Installing Python dependencies...")
 
-    # Upgrade pip
-    run_command("python -m pip install --upgrade pip", "Upgrading pip")
+    # uv resolves and downloads wheels in parallel and starts in
+    # milliseconds — prefer it whenever it's on PATH
+    if shutil.which("uv"):
+        success = run_command(
+            ["uv", "pip", "install", "--python", ".venv/bin/python", "-r", "requirements.txt"],
+            "Installing requirements (uv)"
+        )
+        if not success:
+            log("❌ Failed to install dependencies")
+            sys.exit(1)
+        return
+
+    # Target the venv's own interpreter explicitly: the venv is never
+    # activated in this process, so a bare pip would install into whatever
+    # Python happens to be on PATH — and that empty venv would then get
+    # cached and restored on every later run
+    venv_python = str(Path(".venv") / ("Scripts" if os.name == "nt" else "bin") / "python")
+
+    # ensurepip ships a recent pip on supported Pythons, so a venv we just
+    # built doesn't need the self-upgrade round trip
+    if not fresh_venv:
+        run_command([venv_python, "-m", "pip", "install", "--upgrade", "pip"], "Upgrading pip")
 
     # Install requirements
-    success = run_command("pip install -r requirements.txt", "Installing requirements")
+    success = run_command(
+        [venv_python, "-m", "pip", "install", "-r", "requirements.txt"],
+        "Installing requirements"
+    )
     if not success:
-        print("❌ Failed to install dependencies")
+        log("❌ Failed to install dependencies")
         sys.exit(1)
 
-def create_directories():
+def _materialize_tree(root, spec):
+    """Create directories and package __init__.py files in one fused pass.
+
+    spec is a list of (relative path, is_package) tuples. Deepest paths go
+    first so mkdir(parents=True) brings their ancestors along for free and
+    already-covered prefixes are skipped; each package marker is created
+    right after its directory while the dentry is still hot. Results are
+    printed in one go.
+    """
+    targets = {root / relpath: is_package for relpath, is_package in spec}
+    created = set()
+    for path in sorted(targets, key=lambda p: len(p.parts), reverse=True):
+        if path not in created:
+            path.mkdir(parents=True, exist_ok=True)
+            ancestor = path
+            while ancestor != root and ancestor not in created:
+                created.add(ancestor)
+                ancestor = ancestor.parent
+        if targets[path]:
+            # One open+close at the fd layer instead of Path.touch's
+            # stat-then-open dance; O_CREAT makes it a no-op when present
+            os.close(os.open(str(path / "__init__.py"), os.O_WRONLY | os.O_CREAT, 0o644))
+
+    log("\n".join(f"✅ Created {relpath}/ directory" for relpath, _ in spec))
+
+@staged
+def create_directories(root):
     """Create necessary directories"""
-    print("\n📁 Creating project directories...")
+    log("\n📁 Creating project directories...")
 
+    # (relative path, is Python package)
     directories = [
-        "logs",
-        "data",
-        "uploads",
-        "backups",
-        "cache",
-        "temp",
-        "output",
-        "generated",
-        "Projects_Derived",
-        "LLM_output",
-        "JSON_output",
-        "media_output",
-        "PDF_output",
-        "src",
-        "src/core",
-        "src/agents",
-        "src/workflows",
-        "src/tools",
-        "src/api",
-        "tests",
-        "monitoring",
-        "monitoring/grafana/dashboards",
-        "monitoring/grafana/datasources"
+        ("logs", False),
+        ("data", False),
+        ("uploads", False),
+        ("backups", False),
+        ("cache", False),
+        ("temp", False),
+        ("output", False),
+        ("generated", False),
+        ("Projects_Derived", False),
+        ("LLM_output", False),
+        ("JSON_output", False),
+        ("media_output", False),
+        ("PDF_output", False),
+        ("src", True),
+        ("src/core", True),
+        ("src/agents", True),
+        ("src/workflows", True),
+        ("src/tools", True),
+        ("src/api", True),
+        ("tests", True),
+        ("monitoring", False),
+        ("monitoring/grafana/dashboards", False),
+        ("monitoring/grafana/datasources", False)
     ]
 
-    for directory in directories:
-        dir_path = Path.cwd() / directory
-        dir_path.mkdir(parents=True, exist_ok=True)
-        print(f"✅ Created {directory}/ directory")
-
-def setup_environment_file():
+    # On re-runs everything already exists: one scandir of the root plus
+    # the package markers confirms the tree is intact, and skipping also
+    # avoids resurrecting files a developer deliberately removed
+    present = {entry.name for entry in os.scandir(root) if entry.is_dir()}
+    if all(Path(relpath).parts[0] in present for relpath, _ in directories) and all(
+        (root / relpath / "__init__.py").exists()
+        for relpath, is_package in directories
+        if is_package
+    ):
+        log("✅ Project directories already in place")
+        return
+
+    _materialize_tree(root, directories)
+
+@staged
+def setup_environment_file(root):
     """Set up environment file"""
-    print("\n🔧 Setting up environment configuration...")
+    log("\n🔧 Setting up environment configuration...")
 
-    env_file = Path.cwd() / ".env"
-    env_example = Path.cwd() / ".env.example"
+    env_file = root / ".env"
+    env_example = root / ".env.example"
 
     if not env_file.exists():
         if env_example.exists():
             import shutil
             shutil.copy(env_example, env_file)
-            print("✅ Created .env from .env.example")
-            print("⚠️  Please edit .env file with your API keys")
+            log("✅ Created .env from .env.example")
+            log("⚠️  Please edit .env file with your API keys")
         else:
-            print("❌ .env.example file not found")
+            log("❌ .env.example file not found")
     else:
-        print("✅ .env file already exists")
+        log("✅ .env file already exists")
 
-def create_docker_environment():
+@staged
+def create_docker_environment(root):
     """Create Docker-related files"""
-    print("\n🐳 Setting up Docker environment...")
+    log("\n🐳 Setting up Docker environment...")
 
     # Create Docker directories
     docker_dirs = ["nginx/ssl", "backups/docker", "logs/nginx"]
-    for directory in docker_dirs:
-        dir_path = Path.cwd() / directory
-        dir_path.mkdir(parents=True, exist_ok=True)
-        print(f"✅ Created {directory}/ directory")
+    _materialize_tree(root, [(directory, False) for directory in docker_dirs])
 
     # Create self-signed SSL certificates for development
-    ssl_dir = Path.cwd() / "nginx" / "ssl"
+    ssl_dir = root / "nginx" / "ssl"
     cert_file = ssl_dir / "cert.pem"
     key_file = ssl_dir / "key.pem"
 
     if not cert_file.exists() or not key_file.exists():
-        print("🔐 Creating self-signed SSL certificates...")
-        run_command(
-            f"openssl req -x509 -nodes -days 365 -newkey rsa:2048 "
-            f"-keyout {key_file} -out {cert_file} "
-            f"-subj '/C=US/ST=State/L=City/O=Organization/CN=localhost'",
-            "Creating SSL certificates"
-        )
-
-def create_database_init():
+        log("🔐 Creating self-signed SSL certificates...")
+        try:
+            # Generate in-process: the LLM SDK stack already pulls in
+            # cryptography, so no need to fork the openssl binary
+            _write_self_signed_cert(cert_file, key_file)
+            log("✅ Creating SSL certificates completed")
+        except ImportError:
+            run_command(
+                f"openssl req -x509 -nodes -days 365 -newkey rsa:2048 "
+                f"-keyout {key_file} -out {cert_file} "
+                f"-subj '/C=US/ST=State/L=City/O=Organization/CN=localhost'",
+                "Creating SSL certificates"
+            )
+
+def _write_self_signed_cert(cert_file, key_file):
+    """Generate a self-signed localhost certificate with cryptography."""
+    from datetime import datetime, timedelta
+
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    subject = x509.Name([
+        x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
+        x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "State"),
+        x509.NameAttribute(NameOID.LOCALITY_NAME, "City"),
+        x509.NameAttribute(NameOID.ORGANIZATION_NAME, "Organization"),
+        x509.NameAttribute(NameOID.COMMON_NAME, "localhost"),
+    ])
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(subject)
+        .issuer_name(subject)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(datetime.utcnow())
+        .not_valid_after(datetime.utcnow() + timedelta(days=365))
+        .sign(key, hashes.SHA256())
+    )
+
+    key_file.write_bytes(key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        encryption_algorithm=serialization.NoEncryption(),
+    ))
+    cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+
+@staged
+def create_database_init(root):
     """Create database initialization script"""
-    print("\n🗄️  Creating database initialization script...")
+    log("\n🗄️  Creating database initialization script...")
 
     init_sql = """-- AI Crew Builder Team - Database Initialization
 CREATE DATABASE IF NOT EXISTS builder_team;
@@ -190,131 +419,155 @@ CREATE TABLE IF NOT EXISTS openspec_changes (
 );
 """
 
-    init_script = Path.cwd() / "scripts" / "init-db.sql"
-    with open(init_script, 'w') as f:
-        f.write(init_sql)
-    print("✅ Created database initialization script")
-
-def create_basic_project_structure():
-    """Create basic Python project structure"""
-    print("\n🏗️  Creating basic project structure...")
-
-    # Create __init__.py files
-    init_files = [
-        "src/__init__.py",
-        "src/core/__init__.py",
-        "src/agents/__init__.py",
-        "src/workflows/__init__.py",
-        "src/tools/__init__.py",
-        "src/api/__init__.py",
-        "tests/__init__.py"
-    ]
-
-    for init_file in init_files:
-        file_path = Path.cwd() / init_file
-        if not file_path.exists():
-            file_path.touch()
-            print(f"✅ Created {init_file}")
+    init_script = root / "scripts" / "init-db.sql"
+    payload = init_sql.encode()
+    try:
+        # First run: exclusive create writes the file in one shot without
+        # the stat-then-truncate round trip
+        fd = os.open(init_script, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        log("✅ Created database initialization script")
+    except FileExistsError:
+        # Re-runs are the common case; skip the write (and its journal
+        # traffic) when the script on disk already matches
+        if init_script.read_bytes() == payload:
+            log("✅ Database initialization script up to date")
+        else:
+            init_script.write_bytes(payload)
+            log("✅ Updated database initialization script")
 
-def test_local_setup():
+@staged
+def test_local_setup(root):
     """Test local setup"""
-    print("\n🧪 Testing local setup...")
+    log("\n🧪 Testing local setup...")
 
     try:
-        # Test imports
-        import anthropic
-        import openai
-        import zhipuai
-        import yaml
-        import dotenv
-        print("✅ All major imports successful")
-
-        # Test configuration loading
-        from dotenv import load_dotenv
-        load_dotenv()
-        print("✅ Environment loading successful")
-
-        # Test directory structure
+        # Verify installation by listing the venv's .dist-info directories:
+        # one directory scan, no module code executed at all. Distribution
+        # names, not import names (yaml ships as pyyaml, dotenv as
+        # python-dotenv).
+        version = sys.version_info
+        site_packages = root / ".venv" / "lib" / f"python{version.major}.{version.minor}" / "site-packages"
+        required_dists = {"anthropic", "openai", "zhipuai", "pyyaml", "python-dotenv"}
+        if site_packages.is_dir():
+            installed = {
+                entry.name.split("-")[0].lower().replace("_", "-")
+                for entry in os.scandir(site_packages)
+                if entry.name.endswith(".dist-info")
+            }
+            missing = sorted(required_dists - installed)
+        else:
+            # Not running against the project venv (e.g. system install):
+            # fall back to resolving the import names without importing
+            import importlib.util
+            required_modules = ("anthropic", "openai", "zhipuai", "yaml", "dotenv")
+            missing = [m for m in required_modules if importlib.util.find_spec(m) is None]
+        if missing:
+            log(f"❌ Import test failed: missing {', '.join(missing)}")
+            return False
+        log("✅ All major imports successful")
+
+        # Test directory structure: one scandir of the root enumerates all
+        # entries instead of a stat per required directory
         required_dirs = ["config", "scripts", "openspec", "logs", "src"]
+        present = {entry.name for entry in os.scandir(root) if entry.is_dir()}
         for dir_name in required_dirs:
-            dir_path = Path.cwd() / dir_name
-            if dir_path.exists():
-                print(f"✅ {dir_name}/ directory exists")
+            if dir_name in present:
+                log(f"✅ {dir_name}/ directory exists")
             else:
-                print(f"❌ {dir_name}/ directory missing")
+                log(f"❌ {dir_name}/ directory missing")
 
-    except ImportError as e:
-        print(f"❌ Import test failed: {e}")
-        return False
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        log(f"❌ Test failed: {e}")
         return False
 
     return True
 
+@staged
 def test_docker_setup():
     """Test Docker setup"""
-    print("\n🐳 Testing Docker setup...")
+    log("\n🐳 Testing Docker setup...")
+
+    import shutil
 
-    # Check Docker
-    docker_check = run_command("docker --version", "Checking Docker", check=False)
-    if not docker_check:
-        print("⚠️  Docker not available - skipping Docker tests")
+    # A PATH scan answers "is it installed?" without forking the docker
+    # binary for a --version round trip; with --type both on a machine
+    # without Docker this returns before any subprocess is spawned
+    if shutil.which("docker") is None:
+        log("⚠️  Docker not installed - skipping Docker tests")
         return True
 
-    # Check Docker Compose
-    compose_check = run_command("docker compose version", "Checking Docker Compose", check=False)
+    # Compose v2 ships as a CLI plugin file; checking the well-known plugin
+    # locations (or PATH for legacy docker-compose) avoids two more spawns
+    plugin_dirs = [
+        Path("/usr/libexec/docker/cli-plugins"),
+        Path("/usr/lib/docker/cli-plugins"),
+        Path.home() / ".docker" / "cli-plugins",
+    ]
+    compose_check = (
+        any((plugin_dir / "docker-compose").exists() for plugin_dir in plugin_dirs)
+        or shutil.which("docker-compose") is not None
+    )
     if not compose_check:
-        compose_check = run_command("docker-compose --version", "Checking docker-compose", check=False)
+        # Path-based detection can miss custom plugin dirs; one subprocess
+        # probe settles it
+        compose_check = run_command("docker compose version", "Checking Docker Compose", check=False)
 
     if not compose_check:
-        print("⚠️  Docker Compose not available - skipping Docker tests")
+        log("⚠️  Docker Compose not available - skipping Docker tests")
         return True
 
-    print("✅ Docker and Docker Compose are available")
+    log("✅ Docker and Docker Compose are available")
     return True
 
+@staged
 def print_next_steps(setup_type):
     """Print next steps for the user"""
-    print("\n🎉 Setup completed successfully!")
-    print("\n📋 Next Steps:")
+    log("\n🎉 Setup completed successfully!")
+    log("\n📋 Next Steps:")
 
     if setup_type in ["local", "both"]:
-        print("\n🏠 Local Development:")
-        print("1. Activate virtual environment:")
+        import platform
+
+        log("\n🏠 Local Development:")
+        log("1. Activate virtual environment:")
         if platform.system().lower() == "windows":
-            print("   .venv\\Scripts\\activate")
+            log("   .venv\\Scripts\\activate")
         else:
-            print("   source .venv/bin/activate")
+            log("   source .venv/bin/activate")
 
-        print("2. Edit your environment file:")
-        print("   nano .env  # or your preferred editor")
-        print("   Add your API keys for Anthropic, ZhipuAI, and OpenAI")
+        log("2. Edit your environment file:")
+        log("   nano .env  # or your preferred editor")
+        log("   Add your API keys for Anthropic, ZhipuAI, and OpenAI")
 
-        print("3. Test the builder team:")
-        print("   python scripts/start.py")
+        log("3. Test the builder team:")
+        log("   python scripts/start.py")
 
     if setup_type in ["docker", "both"]:
-        print("\n🐳 Docker Development:")
-        print("1. Edit your environment file:")
-        print("   nano .env")
-        print("   Add your API keys")
+        log("\n🐳 Docker Development:")
+        log("1. Edit your environment file:")
+        log("   nano .env")
+        log("   Add your API keys")
 
-        print("2. Set up Docker environment:")
-        print("   python scripts/docker-setup.py setup")
+        log("2. Set up Docker environment:")
+        log("   python scripts/docker-setup.py setup")
 
-        print("3. Check service status:")
-        print("   python scripts/docker-setup.py status")
+        log("3. Check service status:")
+        log("   python scripts/docker-setup.py status")
 
-        print("4. View logs:")
-        print("   python scripts/docker-setup.py logs")
+        log("4. View logs:")
+        log("   python scripts/docker-setup.py logs")
 
-        print("5. Access the application at http://localhost:8000")
+        log("5. Access the application at http://localhost:8000")
 
-    print("\n📚 For help, see README.md")
-    print("\n🚀 To initialize a new project:")
-    print("   python scripts/init-project.py")
+    log("\n📚 For help, see README.md")
+    log("\n🚀 To initialize a new project:")
+    log("   python scripts/init-project.py")
 
+@staged
 def main():
     """Main setup function"""
     parser = argparse.ArgumentParser(description="AI Crew Builder Team - Environment Setup")
@@ -322,11 +575,16 @@ def main():
                        help="Type of setup to perform")
     parser.add_argument("--skip-deps", action="store_true",
                        help="Skip installing Python dependencies")
+    parser.add_argument("--force-venv", action="store_true",
+                       help="Recreate the virtual environment without prompting")
 
     args = parser.parse_args()
 
-    print("🚀 AI Crew Builder Team - Complete Environment Setup")
-    print("=" * 60)
+    log("🚀 AI Crew Builder Team - Complete Environment Setup")
+    log("=" * 60)
+
+    # One getcwd for the whole run; every stage resolves against this
+    root = Path.cwd().resolve()
 
     # Check Python version
     check_python_version()
@@ -334,57 +592,61 @@ def main():
     setup_type = args.type
 
     if setup_type in ["local", "both"]:
-        print("\n🏠 Setting up Local Environment")
-        print("-" * 30)
-
-        # Create virtual environment
-        create_virtual_environment()
-
-        # Install dependencies
-        if not args.skip_deps:
-            install_dependencies()
-
-        # Create directories
-        create_directories()
-
-        # Setup environment file
-        setup_environment_file()
-
-        # Create basic structure
-        create_basic_project_structure()
-        create_database_init()
+        log("\n🏠 Setting up Local Environment")
+        log("-" * 30)
+
+        # Create virtual environment (the only stage the install depends on)
+        venv_state = create_virtual_environment(root, force=args.force_venv)
+
+        # The remaining stages touch disjoint paths and none of them need
+        # the venv, so overlap the filesystem work with the dependency
+        # install — the pip run is the long pole and hides all of it
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(create_directories, root),
+                executor.submit(setup_environment_file, root),
+                executor.submit(create_database_init, root),
+            ]
+
+            # Install dependencies (a cache-restored venv already has them)
+            if not args.skip_deps and venv_state != "cached":
+                install_dependencies(fresh_venv=(venv_state == "created"))
+                save_venv_cache(root, root / ".venv")
+
+            for future in futures:
+                future.result()
 
         # Test local setup
-        if test_local_setup():
-            print("✅ Local environment setup completed successfully")
+        if test_local_setup(root):
+            log("✅ Local environment setup completed successfully")
         else:
-            print("⚠️  Local environment setup completed with warnings")
+            log("⚠️  Local environment setup completed with warnings")
 
     if setup_type in ["docker", "both"]:
-        print("\n🐳 Setting up Docker Environment")
-        print("-" * 30)
+        log("\n🐳 Setting up Docker Environment")
+        log("-" * 30)
 
         # Create Docker environment
-        create_docker_environment()
+        create_docker_environment(root)
 
         # Test Docker setup
         if test_docker_setup():
-            print("✅ Docker environment setup completed successfully")
-            print("\n💡 To start Docker services:")
-            print("   python scripts/docker-setup.py setup")
+            log("✅ Docker environment setup completed successfully")
+            log("\n💡 To start Docker services:")
+            log("   python scripts/docker-setup.py setup")
         else:
-            print("⚠️  Docker environment setup completed with warnings")
+            log("⚠️  Docker environment setup completed with warnings")
 
     # Print next steps
     print_next_steps(setup_type)
 
-    print(f"\n🎯 Setup type: {setup_type}")
+    log(f"\n🎯 Setup type: {setup_type}")
     if setup_type == "both":
-        print("💡 You can use both local and Docker environments!")
+        log("💡 You can use both local and Docker environments!")
     elif setup_type == "local":
-        print("💡 Local environment is ready for development!")
+        log("💡 Local environment is ready for development!")
     elif setup_type == "docker":
-        print("💡 Docker environment is ready for deployment!")
+        log("💡 Docker environment is ready for deployment!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,31 +6,65 @@ Launch the Builder Team interface for building AI crew projects.
 
 import asyncio
 import os
+import re
 import sys
 import json
 import logging
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Fast exit for --help before anything heavy loads: the integration
+# imports below transitively pull in the model SDKs and HTTP clients
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] == "--help":
+    print("AI Crew Builder Team - Interactive Interface")
+    print("Usage: python scripts/start.py [--production]")
+    print("  --production: Start in production mode (API server)")
+    print("  --quiet: Only log errors")
+    print("  (no args): Start interactive interface")
+    sys.exit(0)
+
+# Rich is imported lazily: the table/panel/markdown stack pulls in dozens
+# of submodules (pygments included) that --help and --production runs
+# never touch. _load_rich() fills these globals on first use.
+Console = Group = Panel = Prompt = Markdown = Table = Text = None
+_rich_loaded = None
+
+def _load_rich():
+    """Import Rich on first use; returns False when it isn't installed."""
+    global _rich_loaded, Console, Group, Panel, Prompt, Markdown, Table, Text
+    if _rich_loaded is None:
+        try:
+            from rich.console import Console, Group
+            from rich.panel import Panel
+            from rich.prompt import Prompt
+            from rich.markdown import Markdown
+            from rich.table import Table
+            from rich.text import Text
+            _rich_loaded = True
+        except ImportError:
+            _rich_loaded = False
+            print("⚠️  Rich library not available. Using basic output.")
+    return _rich_loaded
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.prompt import Prompt
-    from rich.markdown import Markdown
-    from rich.table import Table
-    from rich.live import Live
-    from rich.text import Text
-    from rich import print as rprint
-    RICH_AVAILABLE = True
+    import aiofiles
 except ImportError:
-    RICH_AVAILABLE = False
-    print("⚠️  Rich library not available. Using basic output.")
+    aiofiles = None
 
-from core.config import get_config, ensure_directories
-from core.integration import get_integration
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.completion import WordCompleter
+except ImportError:
+    PromptSession = None
 
 # Setup logging
 logging.basicConfig(
@@ -39,36 +73,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class BuilderTeamInterface:
-    """Interactive interface for the Builder Team."""
-
-    def __init__(self):
-        self.config = get_config()
-        self.integration = get_integration()
-        self.builder_team = self.integration.builder_team
-        self.console = Console() if RICH_AVAILABLE else None
-        self.session_id = None
+# --quiet drops the interactive loop's INFO chatter (and the per-record
+# strftime it pays for) down to errors only
+if "--quiet" in sys.argv:
+    sys.argv.remove("--quiet")
+    logging.getLogger().setLevel(logging.ERROR)
+
+def dumps_pretty(obj) -> str:
+    """Indent-serialize for display, via orjson's C serializer when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+# Static interface text, defined once at import time. The Rich panels built
+# from these are cached on the interface so repeated help/clear commands
+# don't re-tokenize the markup.
+WELCOME_TEXT = (
+    "[bold blue]🤖 AI Crew Builder Team[/bold blue]\n\n"
+    "Build AI crews with AI - Powered by Claude + ZhipuAI\n\n"
+    "[yellow]Your Builder Team:[/yellow]\n"
+    "📋 Product Strategist (Claude) - Project vision and planning\n"
+    "🏗️  Technical Architect (Claude) - System design and architecture\n"
+    "🎨 UX Designer (Claude) - User experience and workflows\n"
+    "🔍 Quality Engineer (ZhipuAI) - Testing and quality assurance\n"
+    "⚙️  DevOps Specialist (ZhipuAI) - Infrastructure and deployment\n\n"
+    "[green]Type your project idea to get started![/green]\n"
+    "[dim]Type 'help' for commands, 'exit' to quit[/dim]"
+)
 
-    def display_welcome(self):
-        """Display welcome message."""
-        if self.console:
-            panel = Panel(
-                "[bold blue]🤖 AI Crew Builder Team[/bold blue]\n\n"
-                "Build AI crews with AI - Powered by Claude + ZhipuAI\n\n"
-                "[yellow]Your Builder Team:[/yellow]\n"
-                "📋 Product Strategist (Claude) - Project vision and planning\n"
-                "🏗️  Technical Architect (Claude) - System design and architecture\n"
-                "🎨 UX Designer (Claude) - User experience and workflows\n"
-                "🔍 Quality Engineer (ZhipuAI) - Testing and quality assurance\n"
-                "⚙️  DevOps Specialist (ZhipuAI) - Infrastructure and deployment\n\n"
-                "[green]Type your project idea to get started![/green]\n"
-                "[dim]Type 'help' for commands, 'exit' to quit[/dim]",
-                title="Welcome to AI Crew Builder Team",
-                border_style="blue"
-            )
-            self.console.print(panel)
-        else:
-            print("""
+WELCOME_TEXT_PLAIN = """
 🤖 AI Crew Builder Team
 Build AI crews with AI - Powered by Claude + ZhipuAI
 
@@ -81,33 +114,32 @@ Your Builder Team:
 
 Type your project idea to get started!
 Type 'help' for commands, 'exit' to quit
-""")
-
-    def display_agent_status(self):
-        """Display current agent status."""
-        if not self.console:
-            return
-
-        table = Table(title="Builder Team Status")
-        table.add_column("Agent", style="cyan")
-        table.add_column("Status", style="green")
-        table.add_column("Queue", style="yellow")
-        table.add_column("Tasks", style="blue")
-
-        for agent_name, agent in self.builder_team.agents.items():
-            status = agent.get_status()
-            table.add_row(
-                agent_name,
-                status["status"],
-                str(status["queue_size"]),
-                str(status["tasks_completed"])
-            )
+"""
 
-        self.console.print(table)
+# User-friendly aliases for agent names, frozen so the same mapping
+# object is reused on every `ask` command
+AGENT_ALIASES = MappingProxyType({
+    'strategist': 'ProductStrategist',
+    'architect': 'TechnicalArchitect',
+    'designer': 'UXDesigner',
+    'quality': 'QualityEngineer',
+    'devops': 'DevOpsSpecialist',
+    'product': 'ProductStrategist',
+    'tech': 'TechnicalArchitect',
+    'ux': 'UXDesigner',
+    'qa': 'QualityEngineer'
+})
+
+# Collapses anything unsafe in a project name (spaces, slashes, colons)
+# to underscores in one C-level pass
+_FILENAME_RE = re.compile(r'[^A-Za-z0-9._-]+')
+
+AVAILABLE_AGENTS_MSG = (
+    "Available agents: ProductStrategist, TechnicalArchitect, UXDesigner, "
+    "QualityEngineer, DevOpsSpecialist"
+)
 
-    def display_help(self):
-        """Display help information."""
-        help_text = """
+HELP_TEXT = """
 # Available Commands
 
 ## Project Commands
@@ -136,28 +168,136 @@ Type 'help' for commands, 'exit' to quit
 - Type 'spec' when ready to generate the complete project specification
 """
 
+class RichPrinter:
+    """Rendering through a Rich console, chosen once at startup."""
+
+    def __init__(self, console):
+        self.console = console
+
+    def line(self, text):
+        self.console.print(text)
+
+    def panel(self, body, title, border_style):
+        self.console.print(Panel(body, title=title, border_style=border_style))
+
+class PlainPrinter:
+    """Plain-stdout rendering with Rich markup stripped."""
+
+    _MARKUP_RE = re.compile(r'\[/?[a-z ]+\]')
+
+    def line(self, text):
+        print(self._MARKUP_RE.sub('', text))
+
+    def panel(self, body, title, border_style):
+        print(f"\n{title}:")
+        print(body)
+
+class BuilderTeamInterface:
+    """Interactive interface for the Builder Team."""
+
+    def __init__(self):
+        # Imported here (not at module top) so argument-handling paths
+        # never load the integration stack
+        from core.config import get_config
+        from core.integration import get_integration
+
+        self.config = get_config()
+        self.integration = get_integration()
+        self.builder_team = self.integration.builder_team
+        # Only load (and pay for) Rich when we're actually talking to a
+        # terminal in interactive mode
+        use_rich = sys.stdout.isatty() and "--production" not in sys.argv and _load_rich()
+        self.console = Console() if use_rich else None
+        # One printer chosen up front replaces the per-call console
+        # None-checks scattered through the output paths
+        self._printer = RichPrinter(self.console) if self.console else PlainPrinter()
+        self.session_id = None
+        self._current_session = None
+
+        # Pre-built renderables for the static panels; Rich re-parses
+        # markup on every print, so tokenize each of these exactly once.
+        # Text.from_markup stores the parsed spans, so re-printing the
+        # panel never hits the markup tokenizer again.
         if self.console:
-            md = Markdown(help_text)
-            self.console.print(Panel(md, title="Help", border_style="green"))
-        else:
-            print(help_text)
+            self._welcome_panel = Panel(
+                Text.from_markup(WELCOME_TEXT),
+                title="Welcome to AI Crew Builder Team",
+                border_style="blue"
+            )
+            self._help_panel = Panel(Markdown(HELP_TEXT), title="Help", border_style="green")
+
+        # Command dispatch: one dict lookup per input line instead of
+        # walking an elif chain. Handlers may be sync or async.
+        self._commands = {
+            'help': self.display_help,
+            'clear': self._clear_screen,
+            'status': self._show_status,
+            'agents': self.display_agent_status,
+            'config': self.display_configuration,
+            'new': self.start_new_project,
+            'spec': self.generate_specification,
+            'generate': self.generate_project,
+            'coordinate': self.coordinate_all_agents,
+        }
+
+        # Readline-style editing plus tab completion over the command
+        # table; completions are compiled once instead of per keystroke
+        self._prompt_session = None
+        if PromptSession is not None and sys.stdin.isatty():
+            completions = list(self._commands) + ['exit', 'quit'] + [
+                f"ask {alias}" for alias in AGENT_ALIASES
+            ]
+            self._prompt_session = PromptSession(
+                completer=WordCompleter(completions, ignore_case=True)
+            )
+
+    def display_welcome(self):
+        """Display welcome message."""
+        if not self.console:
+            print(WELCOME_TEXT_PLAIN)
+            return
+        self.console.print(self._welcome_panel)
+
+    def display_agent_status(self):
+        """Display current agent status."""
+        if not self.console:
+            # Plain path: no Table/Column trees allocated at all
+            for name, agent in self.builder_team.agents.items():
+                status = agent.get_status()
+                print(f"{name}: {status['status']} "
+                      f"(queue {status['queue_size']}, done {status['tasks_completed']})")
+            return
+
+        table = Table(title="Builder Team Status")
+        table.add_column("Agent", style="cyan")
+        table.add_column("Status", style="green")
+        table.add_column("Queue", style="yellow")
+        table.add_column("Tasks", style="blue")
+
+        # Collect all statuses first, then fill the table in one tight
+        # pass so row construction isn't interleaved with status calls
+        rows = [
+            (agent_name, status["status"], str(status["queue_size"]), str(status["tasks_completed"]))
+            for agent_name, status in (
+                (name, agent.get_status())
+                for name, agent in self.builder_team.agents.items()
+            )
+        ]
+        for row in rows:
+            table.add_row(*row)
+
+        self.console.print(table)
+
+    def display_help(self):
+        """Display help information."""
+        if not self.console:
+            print(HELP_TEXT)
+            return
+        self.console.print(self._help_panel)
 
     def display_configuration(self):
         """Display current configuration."""
-        if self.console:
-            table = Table(title="Configuration")
-            table.add_column("Setting", style="cyan")
-            table.add_column("Value", style="white")
-
-            table.add_row("Project Name", self.config.project_name)
-            table.add_row("Environment", self.config.environment)
-            table.add_row("Claude Model", self.config.claude_model)
-            table.add_row("ZhipuAI Model", self.config.zhipuai_model)
-            table.add_row("OpenAI Model", self.config.openai_model)
-            table.add_row("Debug Mode", str(self.config.debug_mode))
-
-            self.console.print(table)
-        else:
+        if not self.console:
             print(f"""
 Configuration:
 - Project Name: {self.config.project_name}
@@ -167,62 +307,60 @@ Configuration:
 - OpenAI Model: {self.config.openai_model}
 - Debug Mode: {self.config.debug_mode}
 """)
+            return
 
-    async def handle_command(self, user_input: str) -> bool:
-        """Handle special commands."""
-        input_lower = user_input.lower().strip()
-
-        if input_lower in ['exit', 'quit', 'q']:
-            return False
-
-        elif input_lower == 'help':
-            self.display_help()
-
-        elif input_lower == 'clear':
-            os.system('clear' if os.name == 'posix' else 'cls')
-            self.display_welcome()
-
-        elif input_lower == 'status':
-            if self.session_id:
-                status = await self.builder_team.get_session_status(self.session_id)
-                if self.console:
-                    self.console.print(Panel(
-                        json.dumps(status, indent=2),
-                        title="Project Status",
-                        border_style="blue"
-                    ))
-                else:
-                    print("Project Status:")
-                    print(json.dumps(status, indent=2))
-            else:
-                print("No active project session. Type 'new' to start a project.")
+        table = Table(title="Configuration")
+        table.add_column("Setting", style="cyan")
+        table.add_column("Value", style="white")
 
-        elif input_lower == 'agents':
-            self.display_agent_status()
+        table.add_row("Project Name", self.config.project_name)
+        table.add_row("Environment", self.config.environment)
+        table.add_row("Claude Model", self.config.claude_model)
+        table.add_row("ZhipuAI Model", self.config.zhipuai_model)
+        table.add_row("OpenAI Model", self.config.openai_model)
+        table.add_row("Debug Mode", str(self.config.debug_mode))
 
-        elif input_lower == 'config':
-            self.display_configuration()
+        self.console.print(table)
 
-        elif input_lower == 'new':
-            await self.start_new_project()
+    def _clear_screen(self):
+        """Clear the screen and redraw the welcome panel."""
+        # Clear in-process; forking a shell for `clear`/`cls` costs a
+        # full process spawn for a two-byte escape sequence
+        if self.console:
+            self.console.clear()
+        else:
+            sys.stdout.write("\033[2J\033[H")
+            sys.stdout.flush()
+        self.display_welcome()
 
-        elif input_lower == 'spec':
-            await self.generate_specification()
+    async def _show_status(self):
+        """Display the current session status."""
+        if self.session_id:
+            status = await self.builder_team.get_session_status(self.session_id)
+            self._printer.panel(dumps_pretty(status), title="Project Status", border_style="blue")
+        else:
+            print("No active project session. Type 'new' to start a project.")
 
-        elif input_lower == 'generate':
-            await self.generate_project()
+    async def handle_command(self, user_input: str) -> bool:
+        """Handle special commands."""
+        input_lower = user_input.lower().strip()
 
-        elif input_lower.startswith('ask '):
-            agent_name = input_lower[4:].strip()
-            await self.ask_specific_agent(agent_name)
+        if input_lower in ('exit', 'quit', 'q'):
+            return False
 
-        elif input_lower == 'coordinate':
-            await self.coordinate_all_agents()
+        # `ask <agent>` carries an argument, so it can't be a plain key
+        if input_lower.startswith('ask '):
+            await self.ask_specific_agent(input_lower[4:].strip())
+            return True
 
-        else:
+        handler = self._commands.get(input_lower)
+        if handler is None:
             # Not a command, process as regular input
             return True
 
+        result = handler()
+        if asyncio.iscoroutine(result):
+            await result
         return True
 
     async def start_new_project(self):
@@ -247,13 +385,11 @@ Configuration:
         }
 
         self.session_id = await self.integration.start_project_session(project_input)
+        # Keep a direct reference so later commands skip the dict lookup
+        self._current_session = self.builder_team.sessions.get(self.session_id)
 
-        if self.console:
-            self.console.print(f"[green]✅ Started new project: {project_name}[/green]")
-            self.console.print(f"[dim]Session ID: {self.session_id}[/dim]")
-        else:
-            print(f"✅ Started new project: {project_name}")
-            print(f"Session ID: {self.session_id}")
+        self._printer.line(f"[green]✅ Started new project: {project_name}[/green]")
+        self._printer.line(f"[dim]Session ID: {self.session_id}[/dim]")
 
     async def ask_specific_agent(self, agent_name: str):
         """Ask a specific agent for help."""
@@ -261,24 +397,11 @@ Configuration:
             print("No active project session. Type 'new' to start a project.")
             return
 
-        # Map user-friendly names to agent names
-        agent_map = {
-            'strategist': 'ProductStrategist',
-            'architect': 'TechnicalArchitect',
-            'designer': 'UXDesigner',
-            'quality': 'QualityEngineer',
-            'devops': 'DevOpsSpecialist',
-            'product': 'ProductStrategist',
-            'tech': 'TechnicalArchitect',
-            'ux': 'UXDesigner',
-            'qa': 'QualityEngineer'
-        }
-
-        actual_agent_name = agent_map.get(agent_name.lower(), agent_name)
+        actual_agent_name = AGENT_ALIASES.get(agent_name.lower(), agent_name)
 
         if actual_agent_name not in self.builder_team.agents:
             print(f"Unknown agent: {agent_name}")
-            print("Available agents: ProductStrategist, TechnicalArchitect, UXDesigner, QualityEngineer, DevOpsSpecialist")
+            print(AVAILABLE_AGENTS_MSG)
             return
 
         if self.console:
@@ -289,17 +412,7 @@ Configuration:
         if question:
             agent = self.builder_team.agents[actual_agent_name]
             response = await agent.think(question)
-
-            if self.console:
-                panel = Panel(
-                    response,
-                    title=f"🤖 {actual_agent_name}",
-                    border_style="blue"
-                )
-                self.console.print(panel)
-            else:
-                print(f"\n🤖 {actual_agent_name}:")
-                print(response)
+            self._printer.panel(response, title=f"🤖 {actual_agent_name}", border_style="blue")
 
     async def coordinate_all_agents(self):
         """Coordinate with all agents."""
@@ -314,17 +427,7 @@ Configuration:
 
         if question:
             response = await self.builder_team.process_user_input(f"[TEAM COORDINATION] {question}")
-
-            if self.console:
-                panel = Panel(
-                    response,
-                    title="🤝 Builder Team Response",
-                    border_style="green"
-                )
-                self.console.print(panel)
-            else:
-                print(f"\n🤝 Builder Team Response:")
-                print(response)
+            self._printer.panel(response, title="🤝 Builder Team Response", border_style="green")
 
     async def generate_specification(self):
         """Generate complete project specification."""
@@ -340,22 +443,28 @@ Configuration:
             specification = spec_result["specification"]
 
             # Save specification to file
-            session = self.builder_team.sessions[self.session_id]
-            filename = f"project_spec_{session.project.name.replace(' ', '_').lower()}.json"
-            filepath = Path.cwd() / "generated" / filename
-
-            # Ensure directory exists
-            filepath.parent.mkdir(exist_ok=True)
+            session = self._current_session or self.builder_team.sessions[self.session_id]
+            safe_name = _FILENAME_RE.sub('_', session.project.name).lower()
+            filepath = Path.cwd() / "generated" / f"project_spec_{safe_name}.json"
+
+            # Serialize up front, then write without blocking the event
+            # loop — agent tasks and callbacks keep running during the dump
+            if orjson is not None:
+                payload = orjson.dumps(specification, option=orjson.OPT_INDENT_2, default=str)
+            else:
+                payload = json.dumps(specification, indent=2, default=str).encode()
 
-            with open(filepath, 'w') as f:
-                json.dump(specification, f, indent=2, default=str)
+            await asyncio.to_thread(filepath.parent.mkdir, exist_ok=True)
+            if aiofiles is not None:
+                async with aiofiles.open(filepath, 'wb') as f:
+                    await f.write(payload)
+            else:
+                await asyncio.to_thread(filepath.write_bytes, payload)
 
             if self.console:
-                self.console.print(f"[green]✅ Specification saved to: {filepath}[/green]")
-                self.console.print(f"[dim]OpenSpec Document ID: {spec_result['document_id']}[/dim]")
-
-                # Display summary
-                panel = Panel(
+                # One grouped render: a single markup parse and a single
+                # write instead of one per line/panel
+                summary = Panel(
                     f"Project: {specification['project']['name']}\n"
                     f"Description: {specification['project']['description']}\n"
                     f"Agent Specifications: {len(specification['agent_specifications'])}\n"
@@ -364,19 +473,23 @@ Configuration:
                     title="📋 Specification Generated",
                     border_style="blue"
                 )
-                self.console.print(panel)
+                self.console.print(Group(
+                    f"[green]✅ Specification saved to: {filepath}[/green]",
+                    f"[dim]OpenSpec Document ID: {spec_result['document_id']}[/dim]",
+                    summary
+                ))
             else:
-                print(f"✅ Specification saved to: {filepath}")
-                print(f"OpenSpec Document ID: {spec_result['document_id']}")
-                print(f"Project: {specification['project']['name']}")
-                print(f"Agent Specifications: {len(specification['agent_specifications'])}")
+                # One write instead of a flush-per-print over slow pipes
+                sys.stdout.write("\n".join([
+                    f"✅ Specification saved to: {filepath}",
+                    f"OpenSpec Document ID: {spec_result['document_id']}",
+                    f"Project: {specification['project']['name']}",
+                    f"Agent Specifications: {len(specification['agent_specifications'])}",
+                ]) + "\n")
 
         except Exception as e:
-            logger.error(f"Error generating specification: {e}")
-            if self.console:
-                self.console.print(f"[red]❌ Error generating specification: {e}[/red]")
-            else:
-                print(f"❌ Error generating specification: {e}")
+            logger.error("Error generating specification: %s", e)
+            self._printer.line(f"[red]❌ Error generating specification: {e}[/red]")
 
     async def generate_project(self):
         """Generate complete project from specification."""
@@ -392,12 +505,9 @@ Configuration:
             generation_result = result["generation_result"]
 
             if self.console:
-                self.console.print(f"[green]✅ Project generated successfully![/green]")
-                self.console.print(f"[dim]Location: {generation_result['project_dir']}[/dim]")
-                self.console.print(f"[dim]Files created: {generation_result['files_created']}[/dim]")
-
-                # Display summary
-                panel = Panel(
+                # Summary and next-steps panels flush in one grouped
+                # render rather than five separate prints
+                summary = Panel(
                     f"Project: {generation_result['project_name']}\n"
                     f"Location: {generation_result['project_dir']}\n"
                     f"Files Created: {generation_result['files_created']}\n"
@@ -406,9 +516,6 @@ Configuration:
                     title="🚀 Project Generated",
                     border_style="green"
                 )
-                self.console.print(panel)
-
-                # Next steps
                 next_steps = Panel(
                     f"Next steps for your project:\n"
                     f"1. cd {generation_result['project_dir']}\n"
@@ -418,23 +525,30 @@ Configuration:
                     title="📋 Next Steps",
                     border_style="yellow"
                 )
-                self.console.print(next_steps)
+                self.console.print(Group(
+                    f"[green]✅ Project generated successfully![/green]",
+                    f"[dim]Location: {generation_result['project_dir']}[/dim]",
+                    f"[dim]Files created: {generation_result['files_created']}[/dim]",
+                    summary,
+                    next_steps
+                ))
             else:
-                print(f"✅ Project generated successfully!")
-                print(f"Location: {generation_result['project_dir']}")
-                print(f"Files created: {generation_result['files_created']}")
-                print(f"\nNext steps:")
-                print(f"1. cd {generation_result['project_dir']}")
-                print(f"2. python scripts/setup.py")
-                print(f"3. Add your OpenAI API key to .env")
-                print(f"4. python main.py")
+                # One write instead of a flush-per-print over slow pipes
+                sys.stdout.write("\n".join([
+                    "✅ Project generated successfully!",
+                    f"Location: {generation_result['project_dir']}",
+                    f"Files created: {generation_result['files_created']}",
+                    "",
+                    "Next steps:",
+                    f"1. cd {generation_result['project_dir']}",
+                    "2. python scripts/setup.py",
+                    "3. Add your OpenAI API key to .env",
+                    "4. python main.py",
+                ]) + "\n")
 
         except Exception as e:
-            logger.error(f"Error generating project: {e}")
-            if self.console:
-                self.console.print(f"[red]❌ Error generating project: {e}[/red]")
-            else:
-                print(f"❌ Error generating project: {e}")
+            logger.error("Error generating project: %s", e)
+            self._printer.line(f"[red]❌ Error generating project: {e}[/red]")
 
     async def process_user_input(self, user_input: str):
         """Process regular user input through the integration layer."""
@@ -445,38 +559,24 @@ Configuration:
 
             result = await self.integration.process_user_input(self.session_id, user_input)
             response = result["response"]
-
-            if self.console:
-                panel = Panel(
-                    response,
-                    title="🤖 Builder Team",
-                    border_style="blue"
-                )
-                self.console.print(panel)
-            else:
-                print(f"\n🤖 Builder Team:")
-                print(response)
+            self._printer.panel(response, title="🤖 Builder Team", border_style="blue")
 
         except Exception as e:
-            logger.error(f"Error processing input: {e}")
-            if self.console:
-                self.console.print(f"[red]❌ Error: {e}[/red]")
-            else:
-                print(f"❌ Error: {e}")
+            logger.error("Error processing input: %s", e)
+            self._printer.line(f"[red]❌ Error: {e}[/red]")
 
     async def run_interactive(self):
         """Run the interactive interface."""
-        # Ensure directories exist
-        ensure_directories()
-
-        # Display welcome
+        # Display welcome (directories are ensured during startup in main)
         self.display_welcome()
 
         # Main interaction loop
         while True:
             try:
                 # Get user input
-                if self.console:
+                if self._prompt_session is not None:
+                    user_input = (await self._prompt_session.prompt_async("\n💬 You: ")).strip()
+                elif self.console:
                     user_input = Prompt.ask("\n💬 You", default="")
                 else:
                     user_input = input("\n💬 You: ").strip()
@@ -500,48 +600,41 @@ Configuration:
                 print("\n\n👋 Goodbye!")
                 break
             except Exception as e:
-                logger.error(f"Unexpected error: {e}")
-                if self.console:
-                    self.console.print(f"[red]❌ Unexpected error: {e}[/red]")
-                else:
-                    print(f"❌ Unexpected error: {e}")
+                logger.error("Unexpected error: %s", e)
+                self._printer.line(f"[red]❌ Unexpected error: {e}[/red]")
 
 async def main():
     """Main entry point."""
-    # Check environment
-    config = get_config()
+    from core.config import ensure_directories, get_config
 
-    if not config.anthropic_api_key:
-        print("❌ ANTHROPIC_API_KEY not found in environment variables")
-        print("Please set your API keys in .env file")
-        sys.exit(1)
-
-    if not config.zhipuai_api_key:
-        print("❌ ZHIPUAI_API_KEY not found in environment variables")
-        print("Please set your API keys in .env file")
-        sys.exit(1)
+    # Check environment: collect every missing key in one pass so the
+    # user sees the full list instead of fixing them one at a time
+    config = get_config()
 
-    if not config.openai_api_key:
-        print("❌ OPENAI_API_KEY not found in environment variables")
+    missing = [
+        key for key in ("anthropic_api_key", "zhipuai_api_key", "openai_api_key")
+        if not getattr(config, key)
+    ]
+    if missing:
+        for key in missing:
+            print(f"❌ {key.upper()} not found in environment variables")
         print("Please set your API keys in .env file")
         sys.exit(1)
 
     # Create and run interface
     interface = BuilderTeamInterface()
 
-    # Initialize the integration system
+    # Initialize the integration system; directory creation is independent
+    # filesystem work, so it runs concurrently with the provider handshakes
     try:
-        await interface.integration.initialize()
-        if interface.console:
-            interface.console.print("[green]✅ Builder Team system initialized[/green]")
-        else:
-            print("✅ Builder Team system initialized")
+        await asyncio.gather(
+            interface.integration.initialize(),
+            asyncio.to_thread(ensure_directories),
+        )
+        interface._printer.line("[green]✅ Builder Team system initialized[/green]")
     except Exception as e:
-        logger.error(f"Error initializing system: {e}")
-        if interface.console:
-            interface.console.print(f"[red]❌ Error initializing system: {e}[/red]")
-        else:
-            print(f"❌ Error initializing system: {e}")
+        logger.error("Error initializing system: %s", e)
+        interface._printer.line(f"[red]❌ Error initializing system: {e}[/red]")
         sys.exit(1)
 
     try:
@@ -549,7 +642,7 @@ async def main():
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         print(f"❌ Fatal error: {e}")
         sys.exit(1)
     finally:
@@ -563,14 +656,15 @@ if __name__ == "__main__":
             # Production mode
             print("🚀 Starting AI Crew Builder Team in production mode...")
             # TODO: Implement production mode (FastAPI server)
-        elif sys.argv[1] == "--help":
-            print("AI Crew Builder Team - Interactive Interface")
-            print("Usage: python scripts/start.py [--production]")
-            print("  --production: Start in production mode (API server)")
-            print("  (no args): Start interactive interface")
         else:
             print(f"Unknown argument: {sys.argv[1]}")
             print("Use --help for usage information")
     else:
-        # Run interactive mode
+        # Run interactive mode; uvloop's libuv-based loop schedules the
+        # agent coroutines noticeably faster when it's installed
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
         asyncio.run(main())
\ No newline at end of file
@@ -3,64 +3,32 @@ AI Crew Builder Team - Builder Team Agents
 Implementation of the 5 advisory team agents for strategic guidance.
 """
 
-import json
 import asyncio
-from typing import Dict, List, Any, Optional
+import hashlib
+from collections import OrderedDict
+from types import MappingProxyType
+from string import Template
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 from ..core.agent import BaseAgent, AgentTask, get_coordinator
 from ..core.config import get_config
-
-class ProductStrategistAgent(BaseAgent):
-    """Product Strategist - Provides product vision and strategic planning."""
-
-    def __init__(self):
-        super().__init__(
-            name="ProductStrategist",
-            role="Product Vision and Strategic Planning",
-            mbti="ENTJ",
-            provider="claude",
-            responsibilities=[
-                "Define project roadmap and milestones",
-                "Make strategic decisions on feature prioritization",
-                "Coordinate between advisory and application teams",
-                "Validate business logic implementation",
-                "Analyze market requirements and user needs",
-                "Define success metrics and KPIs"
-            ]
-        )
-
-        # Add team member to coordinator
-        coordinator = get_coordinator()
-        coordinator.add_team_member(self)
-
-        # Product strategy memory
-        self.add_memory("product_framework", {
-            "vision": "long-term product goals and market positioning",
-            "strategy": "approach to achieve product goals",
-            "roadmap": "timeline and milestones for product development",
-            "metrics": "success measures and KPIs",
-            "stakeholders": "key users and their needs"
-        })
-
-    async def _process_task(self, task: AgentTask) -> str:
-        """Process product strategy tasks."""
-        context = task.context or {}
-
-        if "project_definition" in context:
-            return await self._analyze_project_definition(context["project_definition"])
-        elif "feature_prioritization" in context:
-            return await self._prioritize_features(context["feature_prioritization"])
-        elif "roadmap_planning" in context:
-            return await self._create_roadmap(context["roadmap_planning"])
-        elif "market_analysis" in context:
-            return await self._analyze_market(context["market_analysis"])
-        else:
-            # General strategic thinking
-            prompt = f"""
-As the Product Strategist, please provide strategic guidance on: {task.description}
-
-Context: {json.dumps(context, indent=2)}
+from ..core.semantic_cache import canonical_json, get_response_cache
+
+# ---------------------------------------------------------------------------
+# Prompt scaffolding
+#
+# The static prompt text is assembled once at import time as (prefix, suffix)
+# pairs; only the task's JSON context is concatenated in at call time. This
+# avoids rebuilding the multi-line templates on every task and keeps the
+# static prefix byte-identical across calls — the property provider-side
+# prompt-prefix caching keys on.
+# ---------------------------------------------------------------------------
+
+_STRATEGIST_PROMPTS = {
+    "general": (
+        "\nAs the Product Strategist, please provide strategic guidance on: ",
+        """
 
 Please provide:
 1. Strategic assessment
@@ -68,15 +36,11 @@ Please provide:
 3. Recommended approach
 4. Success metrics
 5. Next steps
-"""
-            return await self.think(prompt)
-
-    async def _analyze_project_definition(self, project_def: Dict[str, Any]) -> str:
-        """Analyze and validate project definition."""
-        prompt = f"""
-As Product Strategist, analyze this project definition:
-
-{json.dumps(project_def, indent=2)}
+""",
+    ),
+    "project_definition": (
+        "\nAs Product Strategist, analyze this project definition:\n\n",
+        """
 
 Please provide:
 1. Project viability assessment
@@ -87,15 +51,11 @@ Please provide:
 6. Strategic recommendations
 
 Focus on business value, user needs, and market positioning.
-"""
-        return await self.think(prompt)
-
-    async def _prioritize_features(self, features: List[Dict[str, Any]]) -> str:
-        """Prioritize features based on strategic value."""
-        prompt = f"""
-As Product Strategist, prioritize these features:
-
-{json.dumps(features, indent=2)}
+""",
+    ),
+    "feature_prioritization": (
+        "\nAs Product Strategist, prioritize these features:\n\n",
+        """
 
 Please provide:
 1. Prioritization framework and criteria
@@ -105,15 +65,11 @@ Please provide:
 5. Resource allocation suggestions
 
 Consider user value, business impact, technical feasibility, and market timing.
-"""
-        return await self.think(prompt)
-
-    async def _create_roadmap(self, roadmap_input: Dict[str, Any]) -> str:
-        """Create strategic product roadmap."""
-        prompt = f"""
-As Product Strategist, create a product roadmap for:
-
-{json.dumps(roadmap_input, indent=2)}
+""",
+    ),
+    "roadmap_planning": (
+        "\nAs Product Strategist, create a product roadmap for:\n\n",
+        """
 
 Please provide:
 1. Strategic phases and milestones
@@ -124,15 +80,11 @@ Please provide:
 6. Market entry strategy
 
 Focus on achieving strategic objectives while managing risk and resources.
-"""
-        return await self.think(prompt)
-
-    async def _analyze_market(self, market_data: Dict[str, Any]) -> str:
-        """Analyze market opportunities and positioning."""
-        prompt = f"""
-As Product Strategist, analyze this market data:
-
-{json.dumps(market_data, indent=2)}
+""",
+    ),
+    "market_analysis": (
+        "\nAs Product Strategist, analyze this market data:\n\n",
+        """
 
 Please provide:
 1. Market opportunity assessment
@@ -143,57 +95,14 @@ Please provide:
 6. Market entry timing
 
 Focus on strategic advantages and sustainable differentiation.
-"""
-        return await self.think(prompt)
-
-class TechnicalArchitectAgent(BaseAgent):
-    """Technical Architect - Provides system design and technical strategy."""
-
-    def __init__(self):
-        super().__init__(
-            name="TechnicalArchitect",
-            role="System Design and Technical Strategy",
-            mbti="INTJ",
-            provider="claude",
-            responsibilities=[
-                "Design overall system architecture",
-                "Make technical decisions and trade-offs",
-                "Review and approve technical implementations",
-                "Ensure scalability and performance requirements",
-                "Define technical standards and best practices",
-                "Evaluate technology choices and integrations"
-            ]
-        )
+""",
+    ),
+}
 
-        coordinator = get_coordinator()
-        coordinator.add_team_member(self)
-
-        # Technical architecture memory
-        self.add_memory("technical_framework", {
-            "architecture": "system structure and design patterns",
-            "scalability": "approach to handle growth",
-            "performance": "optimization strategies",
-            "security": "security measures and best practices",
-            "integration": "how components connect and communicate"
-        })
-
-    async def _process_task(self, task: AgentTask) -> str:
-        """Process technical architecture tasks."""
-        context = task.context or {}
-
-        if "system_design" in context:
-            return await self._design_system(context["system_design"])
-        elif "technical_review" in context:
-            return await self._review_technical_design(context["technical_review"])
-        elif "architecture_decision" in context:
-            return await self._make_architecture_decision(context["architecture_decision"])
-        elif "technology_evaluation" in context:
-            return await self._evaluate_technology(context["technology_evaluation"])
-        else:
-            prompt = f"""
-As Technical Architect, provide technical guidance on: {task.description}
-
-Context: {json.dumps(context, indent=2)}
+_ARCHITECT_PROMPTS = {
+    "general": (
+        "\nAs Technical Architect, provide technical guidance on: ",
+        """
 
 Please provide:
 1. Technical assessment
@@ -201,15 +110,11 @@ Please provide:
 3. Technology choices
 4. Implementation considerations
 5. Performance and scalability analysis
-"""
-            return await self.think(prompt)
-
-    async def _design_system(self, design_input: Dict[str, Any]) -> str:
-        """Design system architecture."""
-        prompt = f"""
-As Technical Architect, design the system architecture for:
-
-{json.dumps(design_input, indent=2)}
+""",
+    ),
+    "system_design": (
+        "\nAs Technical Architect, design the system architecture for:\n\n",
+        """
 
 Please provide:
 1. System architecture overview
@@ -221,15 +126,11 @@ Please provide:
 7. Integration points
 
 Focus on maintainability, scalability, and performance.
-"""
-        return await self.think(prompt)
-
-    async def _review_technical_design(self, design_data: Dict[str, Any]) -> str:
-        """Review and validate technical design."""
-        prompt = f"""
-As Technical Architect, review this technical design:
-
-{json.dumps(design_data, indent=2)}
+""",
+    ),
+    "technical_review": (
+        "\nAs Technical Architect, review this technical design:\n\n",
+        """
 
 Please provide:
 1. Architecture assessment
@@ -241,15 +142,11 @@ Please provide:
 7. Risk assessment
 
 Be thorough and constructive in your review.
-"""
-        return await self.think(prompt)
-
-    async def _make_architecture_decision(self, decision_data: Dict[str, Any]) -> str:
-        """Make technical architecture decisions."""
-        prompt = f"""
-As Technical Architect, make an architecture decision for:
-
-{json.dumps(decision_data, indent=2)}
+""",
+    ),
+    "architecture_decision": (
+        "\nAs Technical Architect, make an architecture decision for:\n\n",
+        """
 
 Please provide:
 1. Options analysis with pros/cons
@@ -260,15 +157,11 @@ Please provide:
 6. Success criteria
 
 Consider technical, business, and operational factors.
-"""
-        return await self.think(prompt)
-
-    async def _evaluate_technology(self, tech_data: Dict[str, Any]) -> str:
-        """Evaluate technology choices."""
-        prompt = f"""
-As Technical Architect, evaluate these technology options:
-
-{json.dumps(tech_data, indent=2)}
+""",
+    ),
+    "technology_evaluation": (
+        "\nAs Technical Architect, evaluate these technology options:\n\n",
+        """
 
 Please provide:
 1. Technology comparison matrix
@@ -279,57 +172,14 @@ Please provide:
 6. Recommendations with rationale
 
 Focus on alignment with project goals and constraints.
-"""
-        return await self.think(prompt)
+""",
+    ),
+}
 
-class UXDesignerAgent(BaseAgent):
-    """UX Designer - Provides user experience and interface design."""
-
-    def __init__(self):
-        super().__init__(
-            name="UXDesigner",
-            role="User Experience and Interface Design",
-            mbti="ENFP",
-            provider="claude",
-            responsibilities=[
-                "Design user interactions and workflows",
-                "Create wireframes and prototypes",
-                "Ensure accessibility and usability",
-                "Validate user experience implementation",
-                "Conduct user research and analysis",
-                "Design intuitive and engaging interfaces"
-            ]
-        )
-
-        coordinator = get_coordinator()
-        coordinator.add_team_member(self)
-
-        # UX design memory
-        self.add_memory("ux_framework", {
-            "user_research": "understanding user needs and behaviors",
-            "interaction_design": "how users interact with the system",
-            "visual_design": "aesthetics and visual communication",
-            "usability": "ease of use and learning",
-            "accessibility": "inclusive design for all users"
-        })
-
-    async def _process_task(self, task: AgentTask) -> str:
-        """Process UX design tasks."""
-        context = task.context or {}
-
-        if "user_analysis" in context:
-            return await self._analyze_users(context["user_analysis"])
-        elif "workflow_design" in context:
-            return await self._design_workflows(context["workflow_design"])
-        elif "interface_design" in context:
-            return await self._design_interface(context["interface_design"])
-        elif "usability_review" in context:
-            return await self._review_usability(context["usability_review"])
-        else:
-            prompt = f"""
-As UX Designer, provide design guidance on: {task.description}
-
-Context: {json.dumps(context, indent=2)}
+_UX_PROMPTS = {
+    "general": (
+        "\nAs UX Designer, provide design guidance on: ",
+        """
 
 Please provide:
 1. User experience assessment
@@ -337,15 +187,11 @@ Please provide:
 3. Workflow considerations
 4. Usability improvements
 5. Accessibility considerations
-"""
-            return await self.think(prompt)
-
-    async def _analyze_users(self, user_data: Dict[str, Any]) -> str:
-        """Analyze user needs and behaviors."""
-        prompt = f"""
-As UX Designer, analyze the user data:
-
-{json.dumps(user_data, indent=2)}
+""",
+    ),
+    "user_analysis": (
+        "\nAs UX Designer, analyze the user data:\n\n",
+        """
 
 Please provide:
 1. User persona development
@@ -356,15 +202,11 @@ Please provide:
 6. Research recommendations
 
 Focus on understanding and empathizing with users.
-"""
-        return await self.think(prompt)
-
-    async def _design_workflows(self, workflow_data: Dict[str, Any]) -> str:
-        """Design user workflows and interactions."""
-        prompt = f"""
-As UX Designer, design user workflows for:
-
-{json.dumps(workflow_data, indent=2)}
+""",
+    ),
+    "workflow_design": (
+        "\nAs UX Designer, design user workflows for:\n\n",
+        """
 
 Please provide:
 1. Workflow mapping and optimization
@@ -375,15 +217,11 @@ Please provide:
 6. Efficiency improvements
 
 Focus on intuitive and efficient user experiences.
-"""
-        return await self.think(prompt)
-
-    async def _design_interface(self, interface_data: Dict[str, Any]) -> str:
-        """Design user interface elements."""
-        prompt = f"""
-As UX Designer, design the user interface for:
-
-{json.dumps(interface_data, indent=2)}
+""",
+    ),
+    "interface_design": (
+        "\nAs UX Designer, design the user interface for:\n\n",
+        """
 
 Please provide:
 1. Information architecture
@@ -394,15 +232,11 @@ Please provide:
 6. Responsive design considerations
 
 Consider usability, accessibility, and aesthetic appeal.
-"""
-        return await self.think(prompt)
-
-    async def _review_usability(self, usability_data: Dict[str, Any]) -> str:
-        """Review and improve usability."""
-        prompt = f"""
-As UX Designer, review the usability of:
-
-{json.dumps(usability_data, indent=2)}
+""",
+    ),
+    "usability_review": (
+        "\nAs UX Designer, review the usability of:\n\n",
+        """
 
 Please provide:
 1. Usability assessment
@@ -413,57 +247,14 @@ Please provide:
 6. Testing recommendations
 
 Focus on making the system easy and enjoyable to use.
-"""
-        return await self.think(prompt)
-
-class QualityEngineerAgent(BaseAgent):
-    """Quality Engineer - Provides quality assurance and testing strategy."""
-
-    def __init__(self):
-        super().__init__(
-            name="QualityEngineer",
-            role="Quality Assurance and Testing Strategy",
-            mbti="ISTJ",
-            provider="zhipuai",
-            responsibilities=[
-                "Define testing strategies and frameworks",
-                "Review code quality and standards",
-                "Implement automated testing pipelines",
-                "Ensure reliability and stability",
-                "Monitor system quality metrics",
-                "Establish quality gates and standards"
-            ]
-        )
-
-        coordinator = get_coordinator()
-        coordinator.add_team_member(self)
+""",
+    ),
+}
 
-        # Quality engineering memory
-        self.add_memory("quality_framework", {
-            "testing_strategy": "approach to ensuring quality",
-            "automation": "automated testing and processes",
-            "standards": "coding and quality standards",
-            "metrics": "quality measurement and monitoring",
-            "continuous_improvement": "process optimization"
-        })
-
-    async def _process_task(self, task: AgentTask) -> str:
-        """Process quality engineering tasks."""
-        context = task.context or {}
-
-        if "testing_strategy" in context:
-            return await self._define_testing_strategy(context["testing_strategy"])
-        elif "quality_review" in context:
-            return await self._review_quality(context["quality_review"])
-        elif "automation_planning" in context:
-            return await self._plan_automation(context["automation_planning"])
-        elif "quality_metrics" in context:
-            return await self._define_quality_metrics(context["quality_metrics"])
-        else:
-            prompt = f"""
-As Quality Engineer, provide quality guidance on: {task.description}
-
-Context: {json.dumps(context, indent=2)}
+_QUALITY_PROMPTS = {
+    "general": (
+        "\nAs Quality Engineer, provide quality guidance on: ",
+        """
 
 Please provide:
 1. Quality assessment
@@ -471,15 +262,11 @@ Please provide:
 3. Quality standards
 4. Risk mitigation
 5. Process improvements
-"""
-            return await self.think(prompt)
-
-    async def _define_testing_strategy(self, strategy_data: Dict[str, Any]) -> str:
-        """Define comprehensive testing strategy."""
-        prompt = f"""
-As Quality Engineer, define a testing strategy for:
-
-{json.dumps(strategy_data, indent=2)}
+""",
+    ),
+    "testing_strategy": (
+        "\nAs Quality Engineer, define a testing strategy for:\n\n",
+        """
 
 Please provide:
 1. Testing framework selection
@@ -490,15 +277,11 @@ Please provide:
 6. Risk-based testing approach
 
 Focus on comprehensive quality assurance.
-"""
-        return await self.think(prompt)
-
-    async def _review_quality(self, quality_data: Dict[str, Any]) -> str:
-        """Review quality of deliverables."""
-        prompt = f"""
-As Quality Engineer, review the quality of:
-
-{json.dumps(quality_data, indent=2)}
+""",
+    ),
+    "quality_review": (
+        "\nAs Quality Engineer, review the quality of:\n\n",
+        """
 
 Please provide:
 1. Quality assessment
@@ -509,15 +292,11 @@ Please provide:
 6. Action items
 
 Be thorough and objective in your review.
-"""
-        return await self.think(prompt)
-
-    async def _plan_automation(self, automation_data: Dict[str, Any]) -> str:
-        """Plan test automation."""
-        prompt = f"""
-As Quality Engineer, plan test automation for:
-
-{json.dumps(automation_data, indent=2)}
+""",
+    ),
+    "automation_planning": (
+        "\nAs Quality Engineer, plan test automation for:\n\n",
+        """
 
 Please provide:
 1. Automation framework selection
@@ -528,15 +307,11 @@ Please provide:
 6. Implementation timeline
 
 Focus on sustainable and effective automation.
-"""
-        return await self.think(prompt)
-
-    async def _define_quality_metrics(self, metrics_data: Dict[str, Any]) -> str:
-        """Define quality metrics and monitoring."""
-        prompt = f"""
-As Quality Engineer, define quality metrics for:
-
-{json.dumps(metrics_data, indent=2)}
+""",
+    ),
+    "quality_metrics": (
+        "\nAs Quality Engineer, define quality metrics for:\n\n",
+        """
 
 Please provide:
 1. Key quality indicators
@@ -547,57 +322,14 @@ Please provide:
 6. Continuous improvement metrics
 
 Ensure metrics are meaningful and actionable.
-"""
-        return await self.think(prompt)
-
-class DevOpsSpecialistAgent(BaseAgent):
-    """DevOps Specialist - Provides infrastructure and deployment expertise."""
-
-    def __init__(self):
-        super().__init__(
-            name="DevOpsSpecialist",
-            role="Infrastructure and Deployment",
-            mbti="ISTP",
-            provider="zhipuai",
-            responsibilities=[
-                "Set up CI/CD pipelines",
-                "Manage deployment infrastructure",
-                "Monitor system performance and health",
-                "Implement security and compliance measures",
-                "Optimize system operations",
-                "Ensure reliability and availability"
-            ]
-        )
-
-        coordinator = get_coordinator()
-        coordinator.add_team_member(self)
+""",
+    ),
+}
 
-        # DevOps memory
-        self.add_memory("devops_framework", {
-            "infrastructure": "system deployment and hosting",
-            "automation": "CI/CD and operational automation",
-            "monitoring": "system health and performance monitoring",
-            "security": "infrastructure and operational security",
-            "reliability": "system availability and disaster recovery"
-        })
-
-    async def _process_task(self, task: AgentTask) -> str:
-        """Process DevOps tasks."""
-        context = task.context or {}
-
-        if "infrastructure_design" in context:
-            return await self._design_infrastructure(context["infrastructure_design"])
-        elif "cicd_pipeline" in context:
-            return await self._design_cicd_pipeline(context["cicd_pipeline"])
-        elif "deployment_strategy" in context:
-            return await self._plan_deployment(context["deployment_strategy"])
-        elif "monitoring_setup" in context:
-            return await self._setup_monitoring(context["monitoring_setup"])
-        else:
-            prompt = f"""
-As DevOps Specialist, provide infrastructure guidance on: {task.description}
-
-Context: {json.dumps(context, indent=2)}
+_DEVOPS_PROMPTS = {
+    "general": (
+        "\nAs DevOps Specialist, provide infrastructure guidance on: ",
+        """
 
 Please provide:
 1. Infrastructure assessment
@@ -605,15 +337,11 @@ Please provide:
 3. Operational considerations
 4. Monitoring and alerting
 5. Security measures
-"""
-            return await self.think(prompt)
-
-    async def _design_infrastructure(self, infra_data: Dict[str, Any]) -> str:
-        """Design system infrastructure."""
-        prompt = f"""
-As DevOps Specialist, design infrastructure for:
-
-{json.dumps(infra_data, indent=2)}
+""",
+    ),
+    "infrastructure_design": (
+        "\nAs DevOps Specialist, design infrastructure for:\n\n",
+        """
 
 Please provide:
 1. Infrastructure architecture
@@ -624,15 +352,11 @@ Please provide:
 6. Cost optimization strategies
 
 Focus on reliability, scalability, and cost-effectiveness.
-"""
-        return await self.think(prompt)
-
-    async def _design_cicd_pipeline(self, cicd_data: Dict[str, Any]) -> str:
-        """Design CI/CD pipeline."""
-        prompt = f"""
-As DevOps Specialist, design a CI/CD pipeline for:
-
-{json.dumps(cicd_data, indent=2)}
+""",
+    ),
+    "cicd_pipeline": (
+        "\nAs DevOps Specialist, design a CI/CD pipeline for:\n\n",
+        """
 
 Please provide:
 1. Pipeline architecture and stages
@@ -643,15 +367,11 @@ Please provide:
 6. Monitoring and rollback procedures
 
 Ensure efficient, reliable, and secure deployments.
-"""
-        return await self.think(prompt)
-
-    async def _plan_deployment(self, deploy_data: Dict[str, Any]) -> str:
-        """Plan deployment strategy."""
-        prompt = f"""
-As DevOps Specialist, plan deployment for:
-
-{json.dumps(deploy_data, indent=2)}
+""",
+    ),
+    "deployment_strategy": (
+        "\nAs DevOps Specialist, plan deployment for:\n\n",
+        """
 
 Please provide:
 1. Deployment strategy selection
@@ -662,15 +382,11 @@ Please provide:
 6. Communication and coordination
 
 Focus on smooth, reliable deployments.
-"""
-        return await self.think(prompt)
-
-    async def _setup_monitoring(self, monitoring_data: Dict[str, Any]) -> str:
-        """Set up system monitoring."""
-        prompt = f"""
-As DevOps Specialist, set up monitoring for:
-
-{json.dumps(monitoring_data, indent=2)}
+""",
+    ),
+    "monitoring_setup": (
+        "\nAs DevOps Specialist, set up monitoring for:\n\n",
+        """
 
 Please provide:
 1. Monitoring architecture
@@ -681,16 +397,555 @@ Please provide:
 6. Performance optimization recommendations
 
 Ensure comprehensive system observability.
-"""
-        return await self.think(prompt)
+""",
+    ),
+}
+
+def _compile_prompts(table: Dict[str, tuple]) -> Dict[str, Template]:
+    """Compile the (prefix, suffix) pairs into Templates once at import time.
+
+    Structured prompts take a single $ctx placeholder; the general prompt
+    also takes the task $description. The readable pair literals above stay
+    as the source of truth, and the per-call work reduces to one substitute.
+    """
+    compiled = {}
+    for key, (prefix, suffix) in table.items():
+        if key == "general":
+            compiled[key] = Template(f"{prefix}$description\n\nContext: $ctx{suffix}")
+        else:
+            compiled[key] = Template(f"{prefix}$ctx{suffix}")
+    return compiled
+
+_STRATEGIST_PROMPTS = _compile_prompts(_STRATEGIST_PROMPTS)
+_ARCHITECT_PROMPTS = _compile_prompts(_ARCHITECT_PROMPTS)
+_UX_PROMPTS = _compile_prompts(_UX_PROMPTS)
+_QUALITY_PROMPTS = _compile_prompts(_QUALITY_PROMPTS)
+_DEVOPS_PROMPTS = _compile_prompts(_DEVOPS_PROMPTS)
+
+# Canonical serialization for prompt context: sorted keys and compact
+# separators keep the bytes deterministic (stable cache keys) and minimal
+# (fewer tokens billed than the old indent=2 form).
+_ctx = canonical_json
+
+# Contexts estimated above this many bytes serialize in a worker thread
+_OFFLOAD_THRESHOLD = 16 * 1024
+
+def _rough_size(obj: Any, _depth: int = 3) -> int:
+    """Cheap payload size estimate: string lengths a few levels deep."""
+    if isinstance(obj, str):
+        return len(obj)
+    if _depth and isinstance(obj, dict):
+        return sum(_rough_size(value, _depth - 1) for value in obj.values())
+    if _depth and isinstance(obj, (list, tuple)):
+        return sum(_rough_size(value, _depth - 1) for value in obj)
+    return 8
+
+async def _ctx_async(obj: Any) -> str:
+    """Canonicalize a payload, off the event loop when it is large.
+
+    Serializing a multi-hundred-KB project context inline would stall
+    every other agent sharing the loop; small payloads stay inline to
+    avoid the thread handoff overhead.
+    """
+    if _rough_size(obj) > _OFFLOAD_THRESHOLD:
+        return await asyncio.to_thread(_ctx, obj)
+    return _ctx(obj)
+
+def _build_prompt(prompts: Dict[str, Template], key: str, payload: Any) -> str:
+    """Substitute the dynamic JSON into a precompiled prompt template.
+
+    Accepts either the raw payload or its already-canonicalized JSON
+    string, so the dispatch path can serialize each context exactly once.
+    """
+    ctx = payload if isinstance(payload, str) else _ctx(payload)
+    return prompts[key].substitute(ctx=ctx)
+
+async def _cached_response(agent: BaseAgent, task_type: str, payload: Any, handler) -> str:
+    """Serve identical advisory requests from the response cache.
+
+    On a miss the handler is awaited and its response stored, so repeated
+    (agent, task type, context) triples skip the LLM round-trip entirely.
+    The payload is canonicalized once here and the serialized form is
+    reused for both the cache key and the handler's prompt.
+    """
+    cache = get_response_cache()
+    payload_json = await _ctx_async(payload)
+
+    # Scope the key to the active provider/model so a config switch never
+    # serves answers persisted under the previous model
+    provider = agent.provider_manager.get_provider(agent.provider)
+    model = f"{agent.provider}/{provider.config.model}" if provider else agent.provider
+    key = cache.make_key_from_json(agent.name, task_type, payload_json, model)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Coalesce concurrent identical requests onto one in-flight call
+    flight = agent._inflight.get(key)
+    created = flight is None
+    if created:
+        flight = asyncio.create_task(handler(payload_json))
+        agent._inflight[key] = flight
+        flight.add_done_callback(lambda _t, _key=key: agent._inflight.pop(_key, None))
+
+    response = await flight
+    if created:
+        cache.put(key, response)
+    return response
+
+async def _dispatch_task(agent: BaseAgent, task: AgentTask, prompts: Dict[str, Template]) -> str:
+    """Route a task to the agent's handler table, falling back to general advice."""
+    context = task.context or {}
+
+    for task_type, handler in agent._handlers.items():
+        if task_type in context:
+            return await _cached_response(agent, task_type, context[task_type], handler)
+
+    prompt = prompts["general"].substitute(
+        description=task.description, ctx=await _ctx_async(context)
+    )
+    return await agent.think(prompt, cache_segments=agent._cached_system, task=task)
+
+class BuilderTeamPlanCache:
+    """Memoizes the results of a full advisory run.
+
+    Advisory runs for the same project follow a fixed strategy →
+    architecture → UX → QA → DevOps trajectory. Recording each run's
+    per-agent contexts and results under a project fingerprint lets an
+    exact repeat return the stored results directly, skipping the whole
+    dispatch; any difference in the contexts falls through to the normal
+    path and the new run is recorded.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._plans: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    @staticmethod
+    def fingerprint(project: Dict[str, Any]) -> str:
+        """Build a stable fingerprint for a project definition."""
+        return hashlib.sha256(canonical_json(project).encode("utf-8")).hexdigest()
+
+    def get_results(
+        self,
+        fingerprint: str,
+        contexts: Dict[str, Dict[str, Any]]
+    ) -> Optional[Dict[str, str]]:
+        """Return the memoized results when the recorded run matches exactly."""
+        entry = self._plans.get(fingerprint)
+        if entry is None or entry["contexts"] != contexts:
+            return None
+        self._plans.move_to_end(fingerprint)
+        return entry["results"]
+
+    def record(
+        self,
+        fingerprint: str,
+        contexts: Dict[str, Dict[str, Any]],
+        results: Dict[str, str]
+    ):
+        """Record the contexts and results of a completed dispatch."""
+        self._plans[fingerprint] = {"contexts": contexts, "results": results}
+        self._plans.move_to_end(fingerprint)
+        if len(self._plans) > self.max_entries:
+            self._plans.popitem(last=False)
+
+# Global plan cache shared by team dispatchers
+plan_cache = BuilderTeamPlanCache()
+
+def get_plan_cache() -> BuilderTeamPlanCache:
+    """Get the global plan cache instance."""
+    return plan_cache
+
+async def consult_all(
+    agents: List[BaseAgent],
+    task_description: str,
+    context: Optional[Dict[str, Any]] = None,
+    max_concurrency: int = 5
+) -> Dict[str, str]:
+    """Put the same question to several agents concurrently.
+
+    The advisory calls are pure async I/O against external LLM endpoints,
+    so they are dispatched in one asyncio.gather under a bounded semaphore
+    — the provider sees them together and can batch server-side instead of
+    receiving one request at a time.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def consult(agent: BaseAgent) -> str:
+        async with semaphore:
+            return await agent.process_task(AgentTask(
+                description=task_description,
+                context=dict(context or {})
+            ))
+
+    results = await asyncio.gather(*(consult(agent) for agent in agents))
+    return {agent.name: result for agent, result in zip(agents, results)}
+
+async def run_many(agent: BaseAgent, tasks: List[AgentTask], in_flight: int = 64):
+    """Process a batch of tasks keeping up to ``in_flight`` running at once.
+
+    As each task completes the next queued one is submitted immediately,
+    so the backend's continuous batcher stays saturated instead of seeing
+    one request at a time. Yields tasks in completion order with their
+    status, result, and timestamps filled in.
+    """
+    queue = list(reversed(tasks))
+    pending = set()
+    in_progress: Dict[asyncio.Task, AgentTask] = {}
+
+    while queue or pending:
+        while len(pending) < in_flight and queue:
+            task = queue.pop()
+            task.started_at = datetime.now()
+            future = asyncio.create_task(agent.process_task(task))
+            in_progress[future] = task
+            pending.add(future)
+
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            task = in_progress.pop(future)
+            try:
+                task.result = future.result()
+                task.status = "completed"
+            except Exception as e:
+                task.error = str(e)
+                task.status = "error"
+            task.completed_at = datetime.now()
+            yield task
+
+class ProductStrategistAgent(BaseAgent):
+    """Product Strategist - Provides product vision and strategic planning."""
+
+    __slots__ = ("_cached_system", "_handlers")
+
+    # Product strategy memory, built once and shared read-only across instances
+    _FRAMEWORK = MappingProxyType({
+        "vision": "long-term product goals and market positioning",
+        "strategy": "approach to achieve product goals",
+        "roadmap": "timeline and milestones for product development",
+        "metrics": "success measures and KPIs",
+        "stakeholders": "key users and their needs"
+    })
+
+    def __init__(self):
+        super().__init__(
+            name="ProductStrategist",
+            role="Product Vision and Strategic Planning",
+            mbti="ENTJ",
+            provider="claude",
+            responsibilities=[
+                "Define project roadmap and milestones",
+                "Make strategic decisions on feature prioritization",
+                "Coordinate between advisory and application teams",
+                "Validate business logic implementation",
+                "Analyze market requirements and user needs",
+                "Define success metrics and KPIs"
+            ]
+        )
+
+        # Static system preamble, built once and cache-marked so repeated
+        # advisory calls hit the provider-side prompt cache
+        self._cached_system = [self.system_prompt]
+
+        # Table-driven task dispatch: context key -> handler
+        self._handlers = {
+            "project_definition": self._analyze_project_definition,
+            "feature_prioritization": self._prioritize_features,
+            "roadmap_planning": self._create_roadmap,
+            "market_analysis": self._analyze_market,
+        }
+
+        self.add_memory("product_framework", self._FRAMEWORK)
+
+    async def _process_task(self, task: AgentTask) -> str:
+        """Process product strategy tasks."""
+        return await _dispatch_task(self, task, _STRATEGIST_PROMPTS)
+
+    async def _analyze_project_definition(self, project_def: Any) -> str:
+        """Analyze and validate project definition."""
+        return await self.think(_build_prompt(_STRATEGIST_PROMPTS, "project_definition", project_def), cache_segments=self._cached_system)
+
+    async def _prioritize_features(self, features: Any) -> str:
+        """Prioritize features based on strategic value."""
+        return await self.think(_build_prompt(_STRATEGIST_PROMPTS, "feature_prioritization", features), cache_segments=self._cached_system)
+
+    async def _create_roadmap(self, roadmap_input: Any) -> str:
+        """Create strategic product roadmap."""
+        return await self.think(_build_prompt(_STRATEGIST_PROMPTS, "roadmap_planning", roadmap_input), cache_segments=self._cached_system)
+
+    async def _analyze_market(self, market_data: Any) -> str:
+        """Analyze market opportunities and positioning."""
+        return await self.think(_build_prompt(_STRATEGIST_PROMPTS, "market_analysis", market_data), cache_segments=self._cached_system)
+
+class TechnicalArchitectAgent(BaseAgent):
+    """Technical Architect - Provides system design and technical strategy."""
+
+    __slots__ = ("_cached_system", "_handlers")
+
+    # Technical architecture memory, built once and shared read-only across instances
+    _FRAMEWORK = MappingProxyType({
+        "architecture": "system structure and design patterns",
+        "scalability": "approach to handle growth",
+        "performance": "optimization strategies",
+        "security": "security measures and best practices",
+        "integration": "how components connect and communicate"
+    })
+
+    def __init__(self):
+        super().__init__(
+            name="TechnicalArchitect",
+            role="System Design and Technical Strategy",
+            mbti="INTJ",
+            provider="claude",
+            responsibilities=[
+                "Design overall system architecture",
+                "Make technical decisions and trade-offs",
+                "Review and approve technical implementations",
+                "Ensure scalability and performance requirements",
+                "Define technical standards and best practices",
+                "Evaluate technology choices and integrations"
+            ]
+        )
+
+        # Static system preamble, built once and cache-marked so repeated
+        # advisory calls hit the provider-side prompt cache
+        self._cached_system = [self.system_prompt]
+
+        # Table-driven task dispatch: context key -> handler
+        self._handlers = {
+            "system_design": self._design_system,
+            "technical_review": self._review_technical_design,
+            "architecture_decision": self._make_architecture_decision,
+            "technology_evaluation": self._evaluate_technology,
+        }
+
+        self.add_memory("technical_framework", self._FRAMEWORK)
+
+    async def _process_task(self, task: AgentTask) -> str:
+        """Process technical architecture tasks."""
+        return await _dispatch_task(self, task, _ARCHITECT_PROMPTS)
+
+    async def _design_system(self, design_input: Any) -> str:
+        """Design system architecture."""
+        return await self.think(_build_prompt(_ARCHITECT_PROMPTS, "system_design", design_input), cache_segments=self._cached_system)
+
+    async def _review_technical_design(self, design_data: Any) -> str:
+        """Review and validate technical design."""
+        return await self.think(_build_prompt(_ARCHITECT_PROMPTS, "technical_review", design_data), cache_segments=self._cached_system)
+
+    async def _make_architecture_decision(self, decision_data: Any) -> str:
+        """Make technical architecture decisions."""
+        return await self.think(_build_prompt(_ARCHITECT_PROMPTS, "architecture_decision", decision_data), cache_segments=self._cached_system)
+
+    async def _evaluate_technology(self, tech_data: Any) -> str:
+        """Evaluate technology choices."""
+        return await self.think(_build_prompt(_ARCHITECT_PROMPTS, "technology_evaluation", tech_data), cache_segments=self._cached_system)
+
+class UXDesignerAgent(BaseAgent):
+    """UX Designer - Provides user experience and interface design."""
+
+    __slots__ = ("_cached_system", "_handlers")
+
+    # UX design memory, built once and shared read-only across instances
+    _FRAMEWORK = MappingProxyType({
+        "user_research": "understanding user needs and behaviors",
+        "interaction_design": "how users interact with the system",
+        "visual_design": "aesthetics and visual communication",
+        "usability": "ease of use and learning",
+        "accessibility": "inclusive design for all users"
+    })
+
+    def __init__(self):
+        super().__init__(
+            name="UXDesigner",
+            role="User Experience and Interface Design",
+            mbti="ENFP",
+            provider="claude",
+            responsibilities=[
+                "Design user interactions and workflows",
+                "Create wireframes and prototypes",
+                "Ensure accessibility and usability",
+                "Validate user experience implementation",
+                "Conduct user research and analysis",
+                "Design intuitive and engaging interfaces"
+            ]
+        )
+
+        # Static system preamble, built once and cache-marked so repeated
+        # advisory calls hit the provider-side prompt cache
+        self._cached_system = [self.system_prompt]
+
+        # Table-driven task dispatch: context key -> handler
+        self._handlers = {
+            "user_analysis": self._analyze_users,
+            "workflow_design": self._design_workflows,
+            "interface_design": self._design_interface,
+            "usability_review": self._review_usability,
+        }
+
+        self.add_memory("ux_framework", self._FRAMEWORK)
+
+    async def _process_task(self, task: AgentTask) -> str:
+        """Process UX design tasks."""
+        return await _dispatch_task(self, task, _UX_PROMPTS)
+
+    async def _analyze_users(self, user_data: Any) -> str:
+        """Analyze user needs and behaviors."""
+        return await self.think(_build_prompt(_UX_PROMPTS, "user_analysis", user_data), cache_segments=self._cached_system)
+
+    async def _design_workflows(self, workflow_data: Any) -> str:
+        """Design user workflows and interactions."""
+        return await self.think(_build_prompt(_UX_PROMPTS, "workflow_design", workflow_data), cache_segments=self._cached_system)
+
+    async def _design_interface(self, interface_data: Any) -> str:
+        """Design user interface elements."""
+        return await self.think(_build_prompt(_UX_PROMPTS, "interface_design", interface_data), cache_segments=self._cached_system)
+
+    async def _review_usability(self, usability_data: Any) -> str:
+        """Review and improve usability."""
+        return await self.think(_build_prompt(_UX_PROMPTS, "usability_review", usability_data), cache_segments=self._cached_system)
+
+class QualityEngineerAgent(BaseAgent):
+    """Quality Engineer - Provides quality assurance and testing strategy."""
+
+    __slots__ = ("_cached_system", "_handlers")
+
+    # Quality engineering memory, built once and shared read-only across instances
+    _FRAMEWORK = MappingProxyType({
+        "testing_strategy": "approach to ensuring quality",
+        "automation": "automated testing and processes",
+        "standards": "coding and quality standards",
+        "metrics": "quality measurement and monitoring",
+        "continuous_improvement": "process optimization"
+    })
+
+    def __init__(self):
+        super().__init__(
+            name="QualityEngineer",
+            role="Quality Assurance and Testing Strategy",
+            mbti="ISTJ",
+            provider="zhipuai",
+            responsibilities=[
+                "Define testing strategies and frameworks",
+                "Review code quality and standards",
+                "Implement automated testing pipelines",
+                "Ensure reliability and stability",
+                "Monitor system quality metrics",
+                "Establish quality gates and standards"
+            ]
+        )
+
+        # Static system preamble, built once and cache-marked so repeated
+        # advisory calls hit the provider-side prompt cache
+        self._cached_system = [self.system_prompt]
+
+        # Table-driven task dispatch: context key -> handler
+        self._handlers = {
+            "testing_strategy": self._define_testing_strategy,
+            "quality_review": self._review_quality,
+            "automation_planning": self._plan_automation,
+            "quality_metrics": self._define_quality_metrics,
+        }
+
+        self.add_memory("quality_framework", self._FRAMEWORK)
+
+    async def _process_task(self, task: AgentTask) -> str:
+        """Process quality engineering tasks."""
+        return await _dispatch_task(self, task, _QUALITY_PROMPTS)
+
+    async def _define_testing_strategy(self, strategy_data: Any) -> str:
+        """Define comprehensive testing strategy."""
+        return await self.think(_build_prompt(_QUALITY_PROMPTS, "testing_strategy", strategy_data), cache_segments=self._cached_system)
+
+    async def _review_quality(self, quality_data: Any) -> str:
+        """Review quality of deliverables."""
+        return await self.think(_build_prompt(_QUALITY_PROMPTS, "quality_review", quality_data), cache_segments=self._cached_system)
+
+    async def _plan_automation(self, automation_data: Any) -> str:
+        """Plan test automation."""
+        return await self.think(_build_prompt(_QUALITY_PROMPTS, "automation_planning", automation_data), cache_segments=self._cached_system)
+
+    async def _define_quality_metrics(self, metrics_data: Any) -> str:
+        """Define quality metrics and monitoring."""
+        return await self.think(_build_prompt(_QUALITY_PROMPTS, "quality_metrics", metrics_data), cache_segments=self._cached_system)
+
+class DevOpsSpecialistAgent(BaseAgent):
+    """DevOps Specialist - Provides infrastructure and deployment expertise."""
+
+    __slots__ = ("_cached_system", "_handlers")
+
+    # DevOps memory, built once and shared read-only across instances
+    _FRAMEWORK = MappingProxyType({
+        "infrastructure": "system deployment and hosting",
+        "automation": "CI/CD and operational automation",
+        "monitoring": "system health and performance monitoring",
+        "security": "infrastructure and operational security",
+        "reliability": "system availability and disaster recovery"
+    })
+
+    def __init__(self):
+        super().__init__(
+            name="DevOpsSpecialist",
+            role="Infrastructure and Deployment",
+            mbti="ISTP",
+            provider="zhipuai",
+            responsibilities=[
+                "Set up CI/CD pipelines",
+                "Manage deployment infrastructure",
+                "Monitor system performance and health",
+                "Implement security and compliance measures",
+                "Optimize system operations",
+                "Ensure reliability and availability"
+            ]
+        )
+
+        # Static system preamble, built once and cache-marked so repeated
+        # advisory calls hit the provider-side prompt cache
+        self._cached_system = [self.system_prompt]
+
+        # Table-driven task dispatch: context key -> handler
+        self._handlers = {
+            "infrastructure_design": self._design_infrastructure,
+            "cicd_pipeline": self._design_cicd_pipeline,
+            "deployment_strategy": self._plan_deployment,
+            "monitoring_setup": self._setup_monitoring,
+        }
+
+        self.add_memory("devops_framework", self._FRAMEWORK)
+
+    async def _process_task(self, task: AgentTask) -> str:
+        """Process DevOps tasks."""
+        return await _dispatch_task(self, task, _DEVOPS_PROMPTS)
+
+    async def _design_infrastructure(self, infra_data: Any) -> str:
+        """Design system infrastructure."""
+        return await self.think(_build_prompt(_DEVOPS_PROMPTS, "infrastructure_design", infra_data), cache_segments=self._cached_system)
+
+    async def _design_cicd_pipeline(self, cicd_data: Any) -> str:
+        """Design CI/CD pipeline."""
+        return await self.think(_build_prompt(_DEVOPS_PROMPTS, "cicd_pipeline", cicd_data), cache_segments=self._cached_system)
+
+    async def _plan_deployment(self, deploy_data: Any) -> str:
+        """Plan deployment strategy."""
+        return await self.think(_build_prompt(_DEVOPS_PROMPTS, "deployment_strategy", deploy_data), cache_segments=self._cached_system)
+
+    async def _setup_monitoring(self, monitoring_data: Any) -> str:
+        """Set up system monitoring."""
+        return await self.think(_build_prompt(_DEVOPS_PROMPTS, "monitoring_setup", monitoring_data), cache_segments=self._cached_system)
 
 # Factory function to create all builder team agents
-def create_builder_team() -> List[BaseAgent]:
-    """Create all builder team agents."""
-    return [
+def create_builder_team() -> Tuple[BaseAgent, ...]:
+    """Create all builder team agents and register them with the coordinator."""
+    agents = (
         ProductStrategistAgent(),
         TechnicalArchitectAgent(),
         UXDesignerAgent(),
         QualityEngineerAgent(),
         DevOpsSpecialistAgent()
-    ]
\ No newline at end of file
+    )
+
+    # One coordinator lookup and one bulk registration instead of five
+    get_coordinator().add_team_members(agents)
+
+    return agents
@@ -6,31 +6,80 @@ Defines the base functionality for all Builder Team agents.
 import asyncio
 import json
 import logging
+import time
 import uuid
 from abc import ABC, abstractmethod
+from collections import deque
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Callable
+from typing import Deque, Dict, List, Any, Optional, Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from itertools import count
 
 from .ai_providers import Message, AIResponse, get_provider_manager
 from .config import get_config
 
 logger = logging.getLogger(__name__)
 
+_SYSTEM_PROMPT_TEMPLATE = """You are {name}, a {role} AI agent.
+
+Your MBTI personality type is {mbti}, which influences your approach to problem-solving and communication.
+
+Your core responsibilities:
+{responsibilities}
+
+Guidelines for your responses:
+1. Always consider your personality type ({mbti}) in your approach
+2. Provide clear, actionable advice and solutions
+3. Consider the broader project context and team coordination
+4. Ask clarifying questions when requirements are ambiguous
+5. Document your decisions and reasoning process
+6. Collaborate effectively with other team members
+
+Project Context:
+You are part of the AI Crew Builder Team, responsible for helping users build and design AI crew projects.
+Your role is to provide expert guidance and execute tasks within your domain of expertise.
+
+Communication Style:
+- Be professional but approachable
+- Provide structured, well-reasoned responses
+- Consider practical implementation details
+- Focus on delivering value and progress
+
+Always maintain your role's perspective while considering the overall project success."""
+
+@lru_cache(maxsize=256)
+def _render_system_prompt(name: str, role: str, mbti: str, responsibilities: tuple) -> str:
+    """Render the default system prompt for a persona.
+
+    Memoized so repeatedly spawned agents with the same persona share one
+    rendered string instead of rebuilding it per instance.
+    """
+    return _SYSTEM_PROMPT_TEMPLATE.format(
+        name=name,
+        role=role,
+        mbti=mbti,
+        responsibilities="\n".join(f"- {resp}" for resp in responsibilities)
+    )
+
 class AgentStatus(Enum):
     IDLE = "idle"
     THINKING = "thinking"
     RESPONDING = "responding"
     ERROR = "error"
 
-@dataclass
+@dataclass(slots=True)
 class AgentTask:
     """Represents a task assigned to an agent."""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     description: str = ""
     context: Dict[str, Any] = field(default_factory=dict)
     priority: int = 1
+    latency_class: str = "interactive"  # "interactive" or "batch"
+    stream: bool = False  # stream partial output into partial_result
+    partial_result: str = ""
     created_at: datetime = field(default_factory=datetime.now)
     assigned_at: Optional[datetime] = None
     started_at: Optional[datetime] = None
@@ -38,17 +87,133 @@ class AgentTask:
     status: str = "pending"
     result: Optional[str] = None
     error: Optional[str] = None
+    _done: Optional[asyncio.Event] = field(default=None, repr=False)
+
+    @property
+    def done(self) -> asyncio.Event:
+        """Completion event, set when the task finishes or errors.
+
+        Created lazily so tasks can be built before an event loop exists.
+        """
+        if self._done is None:
+            self._done = asyncio.Event()
+        return self._done
 
-@dataclass
+@dataclass(slots=True)
 class AgentMemory:
     """Agent memory for context retention."""
-    short_term: List[Message] = field(default_factory=list)
+    short_term: Optional[Deque[Message]] = None
     long_term: Dict[str, Any] = field(default_factory=dict)
     context_window: int = 10
 
+    def __post_init__(self):
+        if self.short_term is None:
+            # Bounded deque: appending past the limit evicts the oldest
+            # turns, so no explicit trim pass is ever needed
+            self.short_term = deque(maxlen=self.context_window * 2)
+
+# Task being processed on the current execution path. A context variable
+# rather than an agent attribute, so concurrent tasks on one agent can't
+# see each other's task and every path through process_task is covered
+_current_task: ContextVar[Optional[AgentTask]] = ContextVar("_current_task", default=None)
+
+class AgentDispatcher:
+    """Shared worker pool that executes tasks for all agents.
+
+    One priority queue drained by a small pool of workers replaces the
+    per-agent consumer coroutine and queue, so idle agents cost nothing
+    and scheduler work stays flat as the team grows. Higher-priority
+    tasks drain first; ties keep submission order.
+    """
+
+    max_workers = 32
+
+    def __init__(self):
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._workers: List[asyncio.Task] = []
+        self._seq = count()
+        self._registered = 0
+
+    def register(self, agent: "BaseAgent"):
+        """Register an agent, growing the worker pool if needed."""
+        self._registered += 1
+        self._ensure_workers()
+
+    def _ensure_workers(self):
+        target = min(max(self._registered, 1), self.max_workers)
+        while len(self._workers) < target:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def submit(self, agent: "BaseAgent", task: AgentTask) -> str:
+        """Queue a task for execution on the shared pool."""
+        task.assigned_at = datetime.now()
+        agent.pending_tasks += 1
+        # PriorityQueue pops the smallest tuple first: negate so higher
+        # task.priority wins, with a sequence number as the tiebreaker
+        await self._queue.put((-task.priority, next(self._seq), task, agent))
+        self._ensure_workers()
+        return task.id
+
+    async def _worker(self):
+        while True:
+            _, _, task, agent = await self._queue.get()
+            agent.pending_tasks -= 1
+
+            # One task per agent at a time: another worker may have pulled
+            # a task for the same agent, and current_task, status, and the
+            # stats all assume serialized execution per agent
+            async with agent._task_lock:
+                agent.current_task = task
+                task.started_at = datetime.now()
+                agent.status = AgentStatus.THINKING
+
+                logger.info(f"{agent.name} processing task: {task.description}")
+
+                # Monotonic delta for the stats: cheaper than datetime math
+                # and immune to wall-clock adjustments mid-task
+                t0 = time.monotonic()
+
+                try:
+                    result = await agent.process_task(task)
+
+                    task.status = "completed"
+                    task.result = result
+                    task.completed_at = datetime.now()
+                    agent.tasks_completed += 1
+                    agent.total_response_time += time.monotonic() - t0
+                    agent.status = AgentStatus.IDLE
+
+                except Exception as e:
+                    logger.error(f"Error in {agent.name} task processing: {e}")
+                    task.status = "error"
+                    task.error = str(e)
+                    agent.error_count += 1
+                    agent.status = AgentStatus.ERROR
+
+                finally:
+                    task.done.set()
+                    agent.current_task = None
+                    self._queue.task_done()
+
+# Global dispatcher shared by every agent
+dispatcher = AgentDispatcher()
+
+def get_dispatcher() -> AgentDispatcher:
+    """Get the global agent dispatcher instance."""
+    return dispatcher
+
 class BaseAgent(ABC):
     """Base class for all Builder Team agents."""
 
+    # Fixed attribute layout: no per-instance __dict__, smaller instances
+    # and C-level attribute lookups when many teams are spawned
+    __slots__ = (
+        "name", "role", "mbti", "provider", "responsibilities", "system_prompt",
+        "status", "current_task", "pending_tasks", "memory", "_inflight", "_task_lock",
+        "config", "provider_manager", "message_handlers", "task_handlers",
+        "tasks_completed", "total_response_time", "error_count"
+    )
+
     def __init__(
         self,
         name: str,
@@ -68,9 +233,17 @@ class BaseAgent(ABC):
         # State management
         self.status = AgentStatus.IDLE
         self.current_task: Optional[AgentTask] = None
-        self.task_queue: asyncio.Queue = asyncio.Queue()
+        self.pending_tasks = 0
         self.memory = AgentMemory()
 
+        # In-flight request coalescing: cache key -> running asyncio.Task,
+        # so concurrent identical requests share one LLM call
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # Serializes this agent's dispatched tasks: the shared worker pool
+        # may pick up two of them on different workers at once
+        self._task_lock = asyncio.Lock()
+
         # Configuration
         self.config = get_config()
         self.provider_manager = get_provider_manager()
@@ -88,39 +261,14 @@ class BaseAgent(ABC):
 
     def _generate_system_prompt(self) -> str:
         """Generate default system prompt for the agent."""
-        prompt = f"""You are {self.name}, a {self.role} AI agent.
-
-Your MBTI personality type is {self.mbti}, which influences your approach to problem-solving and communication.
-
-Your core responsibilities:
-{chr(10).join(f"- {resp}" for resp in self.responsibilities)}
-
-Guidelines for your responses:
-1. Always consider your personality type ({self.mbti}) in your approach
-2. Provide clear, actionable advice and solutions
-3. Consider the broader project context and team coordination
-4. Ask clarifying questions when requirements are ambiguous
-5. Document your decisions and reasoning process
-6. Collaborate effectively with other team members
-
-Project Context:
-You are part of the AI Crew Builder Team, responsible for helping users build and design AI crew projects.
-Your role is to provide expert guidance and execute tasks within your domain of expertise.
-
-Communication Style:
-- Be professional but approachable
-- Provide structured, well-reasoned responses
-- Consider practical implementation details
-- Focus on delivering value and progress
-
-Always maintain your role's perspective while considering the overall project success."""
-
-        return prompt
+        return _render_system_prompt(
+            self.name, self.role, self.mbti, tuple(self.responsibilities)
+        )
 
     async def start(self):
-        """Start the agent's main processing loop."""
+        """Start the agent by registering it with the shared dispatcher."""
         logger.info(f"Starting agent: {self.name}")
-        asyncio.create_task(self._process_tasks())
+        get_dispatcher().register(self)
 
     async def stop(self):
         """Stop the agent."""
@@ -129,86 +277,113 @@ Always maintain your role's perspective while considering the overall project su
 
     async def assign_task(self, task: AgentTask) -> str:
         """Assign a task to the agent."""
-        task.assigned_at = datetime.now()
-        await self.task_queue.put(task)
+        task_id = await get_dispatcher().submit(self, task)
         logger.info(f"Task assigned to {self.name}: {task.description}")
-        return task.id
+        return task_id
 
-    async def _process_tasks(self):
-        """Main task processing loop."""
-        while True:
-            try:
-                # Wait for a task
-                self.current_task = await self.task_queue.get()
-                self.current_task.started_at = datetime.now()
-                self.status = AgentStatus.THINKING
-
-                logger.info(f"{self.name} processing task: {self.current_task.description}")
-
-                # Process the task
-                result = await self._process_task(self.current_task)
-
-                # Update task status
-                self.current_task.status = "completed"
-                self.current_task.result = result
-                self.current_task.completed_at = datetime.now()
-                self.tasks_completed += 1
-
-                # Calculate response time
-                if self.current_task.started_at:
-                    response_time = (datetime.now() - self.current_task.started_at).total_seconds()
-                    self.total_response_time += response_time
-
-                self.status = AgentStatus.IDLE
-                self.current_task = None
-
-                # Mark task as done
-                self.task_queue.task_done()
-
-            except Exception as e:
-                logger.error(f"Error in {self.name} task processing: {e}")
-                if self.current_task:
-                    self.current_task.status = "error"
-                    self.current_task.error = str(e)
-                    self.error_count += 1
-                self.status = AgentStatus.ERROR
+    async def process_task(self, task: AgentTask) -> str:
+        """Run a task with it visible to think() on this execution path.
+
+        Call this instead of _process_task directly: it is what makes
+        task-level settings like ``stream`` and ``latency_class`` reach
+        the think() calls made while the task is being processed.
+        """
+        token = _current_task.set(task)
+        try:
+            return await self._process_task(task)
+        finally:
+            _current_task.reset(token)
 
     @abstractmethod
     async def _process_task(self, task: AgentTask) -> str:
         """Process a specific task. Must be implemented by subclasses."""
         pass
 
-    async def think(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
-        """Generate a response using the AI provider."""
+    def _system_messages(self, cache_segments: Optional[List[str]] = None) -> List[Message]:
+        """Build the system messages for a request.
+
+        ``cache_segments`` are static system-prompt segments that providers
+        with prompt caching can mark as cacheable; when omitted the agent's
+        system prompt is sent as a plain system message.
+        """
+        if cache_segments:
+            return [
+                Message(
+                    role="system",
+                    content=segment,
+                    metadata={"cache_control": {"type": "ephemeral"}}
+                )
+                for segment in cache_segments
+            ]
+        return [Message(role="system", content=self.system_prompt)]
+
+    async def think(
+        self,
+        prompt: str,
+        context: Optional[Dict[str, Any]] = None,
+        cache_segments: Optional[List[str]] = None,
+        latency_class: Optional[str] = None,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        task: Optional[AgentTask] = None
+    ) -> str:
+        """Generate a response using the AI provider.
+
+        ``task`` is the task this call is made on behalf of; when omitted
+        it is taken from the processing context set by process_task, so
+        handlers deep in a task don't have to thread it through.
+        ``latency_class`` defaults to that task's class, routing batch
+        tasks through the coalescing batch path.
+
+        When ``on_chunk`` is given — or the task was created with
+        ``stream=True`` — the response is streamed from the provider and
+        partial output accumulates on the task, so downstream consumers
+        can start on it before the full answer is back. The complete
+        response is still returned as a string.
+        """
+        if task is None:
+            task = _current_task.get()
+        if on_chunk is None and task is not None and task.stream:
+            def on_chunk(chunk, _task=task):
+                _task.partial_result += chunk
+
+        if on_chunk is not None:
+            chunks = []
+            async for chunk in self.think_stream(prompt, context, cache_segments):
+                chunks.append(chunk)
+                on_chunk(chunk)
+            return "".join(chunks)
+
         try:
             self.status = AgentStatus.THINKING
 
+            if latency_class is None and task is not None:
+                latency_class = task.latency_class
+
             # Prepare messages
-            messages = [
-                Message(role="system", content=self.system_prompt)
-            ]
+            messages = self._system_messages(cache_segments)
 
             # Add memory context
             if self.memory.short_term:
-                messages.extend(self.memory.short_term[-self.memory.context_window:])
+                messages.extend(list(self.memory.short_term)[-self.memory.context_window:])
 
             # Add current prompt
             user_message = Message(role="user", content=prompt)
             messages.append(user_message)
 
             # Generate response
-            response = await self.provider_manager.generate_response(
-                self.provider, messages
-            )
+            if latency_class == "batch":
+                response = await self.provider_manager.generate_batch_response(
+                    self.provider, messages
+                )
+            else:
+                response = await self.provider_manager.generate_response(
+                    self.provider, messages
+                )
 
             # Update memory
             self.memory.short_term.append(user_message)
             self.memory.short_term.append(Message(role="assistant", content=response.content))
 
-            # Trim memory if too long
-            if len(self.memory.short_term) > self.memory.context_window * 2:
-                self.memory.short_term = self.memory.short_term[-self.memory.context_window:]
-
             self.status = AgentStatus.IDLE
             return response.content
 
@@ -217,39 +392,39 @@ Always maintain your role's perspective while considering the overall project su
             self.status = AgentStatus.ERROR
             raise
 
-    async def think_stream(self, prompt: str, context: Optional[Dict[str, Any]] = None):
-        """Generate a streaming response."""
+    async def think_stream(
+        self,
+        prompt: str,
+        context: Optional[Dict[str, Any]] = None,
+        cache_segments: Optional[List[str]] = None
+    ):
+        """Generate a streaming response, yielding text chunks as they arrive."""
         try:
             self.status = AgentStatus.RESPONDING
 
             # Prepare messages
-            messages = [
-                Message(role="system", content=self.system_prompt)
-            ]
+            messages = self._system_messages(cache_segments)
 
             # Add memory context
             if self.memory.short_term:
-                messages.extend(self.memory.short_term[-self.memory.context_window:])
+                messages.extend(list(self.memory.short_term)[-self.memory.context_window:])
 
             # Add current prompt
             user_message = Message(role="user", content=prompt)
             messages.append(user_message)
 
-            # Generate streaming response
-            full_response = ""
+            # Generate streaming response; collect parts and join once
+            # rather than rebuilding the string on every chunk
+            parts = []
             async for chunk in self.provider_manager.generate_stream(
                 self.provider, messages
             ):
-                full_response += chunk
+                parts.append(chunk)
                 yield chunk
 
             # Update memory
             self.memory.short_term.append(user_message)
-            self.memory.short_term.append(Message(role="assistant", content=full_response))
-
-            # Trim memory if too long
-            if len(self.memory.short_term) > self.memory.context_window * 2:
-                self.memory.short_term = self.memory.short_term[-self.memory.context_window:]
+            self.memory.short_term.append(Message(role="assistant", content="".join(parts)))
 
             self.status = AgentStatus.IDLE
 
@@ -267,7 +442,7 @@ Always maintain your role's perspective while considering the overall project su
             "provider": self.provider,
             "status": self.status.value,
             "current_task": self.current_task.description if self.current_task else None,
-            "queue_size": self.task_queue.qsize(),
+            "queue_size": self.pending_tasks,
             "tasks_completed": self.tasks_completed,
             "average_response_time": (
                 self.total_response_time / self.tasks_completed
@@ -293,6 +468,8 @@ Always maintain your role's perspective while considering the overall project su
 class CoordinatorAgent(BaseAgent):
     """Special agent for coordinating between other agents."""
 
+    __slots__ = ("team_members",)
+
     def __init__(self):
         super().__init__(
             name="Coordinator",
@@ -313,44 +490,41 @@ class CoordinatorAgent(BaseAgent):
         self.team_members[agent.name] = agent
         logger.info(f"Added team member: {agent.name}")
 
+    def add_team_members(self, agents: List[BaseAgent]):
+        """Register several team members in one pass."""
+        self.team_members.update((agent.name, agent) for agent in agents)
+        logger.info(f"Added team members: {', '.join(agent.name for agent in agents)}")
+
     async def coordinate_task(self, task_description: str, target_agents: List[str] = None) -> Dict[str, str]:
-        """Coordinate a task across multiple agents."""
+        """Coordinate a task across multiple agents.
+
+        Each agent's assign/await/collect runs as one coroutine in a
+        single TaskGroup, so results land as each agent finishes instead
+        of every phase waiting on the slowest member.
+        """
         if not target_agents:
             target_agents = list(self.team_members.keys())
 
-        results = {}
-
-        # Create tasks for target agents
-        tasks = []
-        for agent_name in target_agents:
-            if agent_name in self.team_members:
-                agent = self.team_members[agent_name]
-                task = AgentTask(
-                    description=f"Coordination task: {task_description}",
-                    context={"coordinator": self.name, "original_task": task_description}
+        async with asyncio.TaskGroup() as tg:
+            futures = {
+                agent_name: tg.create_task(
+                    self._run_on(self.team_members[agent_name], task_description)
                 )
-                tasks.append((agent, task))
-
-        # Execute tasks concurrently
-        if tasks:
-            await asyncio.gather(*[
-                agent.assign_task(task) for agent, task in tasks
-            ])
-
-            # Wait for completion and collect results
-            await asyncio.gather(*[
-                self._wait_for_task_completion(agent, task) for agent, task in tasks
-            ])
+                for agent_name in target_agents
+                if agent_name in self.team_members
+            }
 
-            for agent, task in tasks:
-                results[agent.name] = task.result or "No result provided"
+        return {name: future.result() for name, future in futures.items()}
 
-        return results
-
-    async def _wait_for_task_completion(self, agent: BaseAgent, task: AgentTask):
-        """Wait for a task to complete."""
-        while task.status not in ["completed", "error"]:
-            await asyncio.sleep(0.1)
+    async def _run_on(self, agent: BaseAgent, task_description: str) -> str:
+        """Run a coordination task on one agent and return its result."""
+        task = AgentTask(
+            description=f"Coordination task: {task_description}",
+            context={"coordinator": self.name, "original_task": task_description}
+        )
+        await agent.assign_task(task)
+        await task.done.wait()
+        return task.result or "No result provided"
 
     async def _process_task(self, task: AgentTask) -> str:
         """Process coordination tasks."""
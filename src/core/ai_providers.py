@@ -4,33 +4,59 @@ Manages interactions with different AI providers (Claude, ZhipuAI, OpenAI).
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, AsyncGenerator
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, AsyncGenerator, Callable
+from dataclasses import dataclass, field
 from enum import Enum
 
-from anthropic import Anthropic
-from openai import OpenAI
-from zhipuai import ZhipuAI
-
 from .config import get_config, AIProviderConfig
 
 logger = logging.getLogger(__name__)
 
+# Shared connection pool for the async provider clients: keep-alive
+# connections skip the TCP/TLS handshake on every call. The SDKs (and
+# httpx itself) are imported lazily so only the configured providers'
+# dependency trees are loaded
+_http_client = None
+
+def _get_http_client():
+    """Get the shared httpx client used by all async provider SDKs."""
+    global _http_client
+    if _http_client is None:
+        import httpx
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=100)
+        )
+    return _http_client
+
 class ProviderType(Enum):
     ANTHROPIC = "anthropic"
     OPENAI = "openai"
     ZHIPUAI = "zhipuai"
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     role: str  # "user", "assistant", "system"
     content: str
     metadata: Optional[Dict[str, Any]] = None
+    _cached_dict: Optional[Dict[str, str]] = field(default=None, repr=False, compare=False)
+
+    def as_dict(self) -> Dict[str, str]:
+        """Provider wire form, built once and reused on later calls.
+
+        A long conversation resends the same Message objects on every
+        request; caching the dict skips rebuilding it each time.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = {"role": self.role, "content": self.content}
+        return self._cached_dict
 
-@dataclass
+@dataclass(slots=True)
 class AIResponse:
     content: str
     provider: str
@@ -69,12 +95,74 @@ class BaseAIProvider(ABC):
         """Generate a streaming response from the AI."""
         pass
 
+# Stream re-batching: flush after this many chunks or this much time,
+# whichever comes first
+_FLUSH_CHUNKS = 32
+_FLUSH_INTERVAL = 0.02
+
+async def _batched(chunks: AsyncGenerator[str, None]) -> AsyncGenerator[str, None]:
+    """Coalesce a token stream into fewer, larger chunks.
+
+    Providers emit hundreds of tiny deltas per response; forwarding each
+    one individually burns a scheduler round-trip per token. Buffering up
+    to 32 chunks or 20ms keeps the stream feeling live while cutting the
+    per-chunk overhead for downstream consumers.
+    """
+    loop = asyncio.get_running_loop()
+    buf: List[str] = []
+    last_flush = loop.time()
+
+    async for chunk in chunks:
+        buf.append(chunk)
+        now = loop.time()
+        if len(buf) >= _FLUSH_CHUNKS or now - last_flush > _FLUSH_INTERVAL:
+            yield "".join(buf)
+            buf.clear()
+            last_flush = now
+
+    if buf:
+        yield "".join(buf)
+
+def _to_claude_format(messages: List[Message]):
+    """Split messages into Claude's (system, messages) shape.
+
+    System messages carrying a ``cache_control`` hint in their metadata are
+    emitted as content blocks with that hint attached, enabling Anthropic's
+    prompt caching for static preambles. Without hints the system prompt is
+    sent as a plain string, preserving the original request shape.
+    """
+    claude_messages = []
+    system_blocks = []
+
+    for msg in messages:
+        if msg.role == "system":
+            block = {"type": "text", "text": msg.content}
+            if msg.metadata and "cache_control" in msg.metadata:
+                block["cache_control"] = msg.metadata["cache_control"]
+            system_blocks.append(block)
+        else:
+            claude_messages.append(msg.as_dict())
+
+    if not system_blocks:
+        system_message = None
+    elif len(system_blocks) == 1 and "cache_control" not in system_blocks[0]:
+        system_message = system_blocks[0]["text"]
+    else:
+        system_message = system_blocks
+
+    return system_message, claude_messages
+
 class AnthropicProvider(BaseAIProvider):
     """Anthropic Claude provider."""
 
     def _initialize_client(self):
         try:
-            self.client = Anthropic(api_key=self.config.api_key)
+            from anthropic import AsyncAnthropic
+
+            self.client = AsyncAnthropic(
+                api_key=self.config.api_key,
+                http_client=_get_http_client()
+            )
             logger.info(f"Initialized Anthropic client with model: {self.config.model}")
         except Exception as e:
             logger.error(f"Failed to initialize Anthropic client: {e}")
@@ -88,20 +176,10 @@ class AnthropicProvider(BaseAIProvider):
         """Generate response using Claude."""
         try:
             # Convert messages to Claude format
-            claude_messages = []
-            system_message = None
-
-            for msg in messages:
-                if msg.role == "system":
-                    system_message = msg.content
-                else:
-                    claude_messages.append({
-                        "role": msg.role,
-                        "content": msg.content
-                    })
+            system_message, claude_messages = _to_claude_format(messages)
 
             # Generate response
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.config.model,
                 max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
                 temperature=kwargs.get("temperature", self.config.temperature),
@@ -132,28 +210,22 @@ class AnthropicProvider(BaseAIProvider):
         """Generate streaming response from Claude."""
         try:
             # Convert messages to Claude format
-            claude_messages = []
-            system_message = None
-
-            for msg in messages:
-                if msg.role == "system":
-                    system_message = msg.content
-                else:
-                    claude_messages.append({
-                        "role": msg.role,
-                        "content": msg.content
-                    })
+            system_message, claude_messages = _to_claude_format(messages)
 
             # Generate streaming response
-            with self.client.messages.stream(
-                model=self.config.model,
-                max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
-                temperature=kwargs.get("temperature", self.config.temperature),
-                system=system_message,
-                messages=claude_messages
-            ) as stream:
-                for text in stream.text_stream:
-                    yield text
+            async def raw():
+                async with self.client.messages.stream(
+                    model=self.config.model,
+                    max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
+                    temperature=kwargs.get("temperature", self.config.temperature),
+                    system=system_message,
+                    messages=claude_messages
+                ) as stream:
+                    async for text in stream.text_stream:
+                        yield text
+
+            async for text in _batched(raw()):
+                yield text
 
         except Exception as e:
             logger.error(f"Error in streaming response from Claude: {e}")
@@ -164,6 +236,8 @@ class ZhipuAIProvider(BaseAIProvider):
 
     def _initialize_client(self):
         try:
+            from zhipuai import ZhipuAI
+
             self.client = ZhipuAI(api_key=self.config.api_key)
             logger.info(f"Initialized ZhipuAI client with model: {self.config.model}")
         except Exception as e:
@@ -178,16 +252,12 @@ class ZhipuAIProvider(BaseAIProvider):
         """Generate response using ZhipuAI."""
         try:
             # Convert messages to ZhipuAI format
-            zhipu_messages = []
-
-            for msg in messages:
-                zhipu_messages.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
+            zhipu_messages = [msg.as_dict() for msg in messages]
 
-            # Generate response
-            response = self.client.chat.completions.create(
+            # The SDK client is synchronous; run it in a worker thread so a
+            # slow call can't stall the event loop mid-fan-out
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self.config.model,
                 messages=zhipu_messages,
                 max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
@@ -217,16 +287,12 @@ class ZhipuAIProvider(BaseAIProvider):
         """Generate streaming response from ZhipuAI."""
         try:
             # Convert messages to ZhipuAI format
-            zhipu_messages = []
-
-            for msg in messages:
-                zhipu_messages.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
+            zhipu_messages = [msg.as_dict() for msg in messages]
 
-            # Generate streaming response
-            response = self.client.chat.completions.create(
+            # Open the stream and pull each chunk in a worker thread; the
+            # sync iterator would otherwise block the loop between chunks
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self.config.model,
                 messages=zhipu_messages,
                 max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
@@ -234,9 +300,18 @@ class ZhipuAIProvider(BaseAIProvider):
                 stream=True
             )
 
-            for chunk in response:
-                if chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+            async def raw():
+                iterator = iter(response)
+                sentinel = object()
+                while True:
+                    chunk = await asyncio.to_thread(next, iterator, sentinel)
+                    if chunk is sentinel:
+                        break
+                    if chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+
+            async for text in _batched(raw()):
+                yield text
 
         except Exception as e:
             logger.error(f"Error in streaming response from ZhipuAI: {e}")
@@ -247,7 +322,12 @@ class OpenAIProvider(BaseAIProvider):
 
     def _initialize_client(self):
         try:
-            self.client = OpenAI(api_key=self.config.api_key)
+            from openai import AsyncOpenAI
+
+            self.client = AsyncOpenAI(
+                api_key=self.config.api_key,
+                http_client=_get_http_client()
+            )
             logger.info(f"Initialized OpenAI client with model: {self.config.model}")
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {e}")
@@ -261,16 +341,10 @@ class OpenAIProvider(BaseAIProvider):
         """Generate response using OpenAI."""
         try:
             # Convert messages to OpenAI format
-            openai_messages = []
-
-            for msg in messages:
-                openai_messages.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
+            openai_messages = [msg.as_dict() for msg in messages]
 
             # Generate response
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.config.model,
                 messages=openai_messages,
                 max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
@@ -300,16 +374,10 @@ class OpenAIProvider(BaseAIProvider):
         """Generate streaming response from OpenAI."""
         try:
             # Convert messages to OpenAI format
-            openai_messages = []
-
-            for msg in messages:
-                openai_messages.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
+            openai_messages = [msg.as_dict() for msg in messages]
 
             # Generate streaming response
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.config.model,
                 messages=openai_messages,
                 max_tokens=kwargs.get("max_tokens", self.config.max_tokens),
@@ -317,14 +385,153 @@ class OpenAIProvider(BaseAIProvider):
                 stream=True
             )
 
-            for chunk in response:
-                if chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+            async def raw():
+                async for chunk in response:
+                    if chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+
+            async for text in _batched(raw()):
+                yield text
 
         except Exception as e:
             logger.error(f"Error in streaming response from OpenAI: {e}")
             raise
 
+class AsyncLRUCache:
+    """In-memory LRU+TTL cache with single-flight request coalescing."""
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 900.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def get(self, key: str):
+        """Return the cached value for a key, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if time.monotonic() > expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value):
+        """Store a value, evicting the least recently used entry if full."""
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def coalesce(self, key: str, factory: Callable):
+        """Share one in-flight call among concurrent identical callers.
+
+        The result is not stored: once the call finishes the key is
+        released and the next caller issues a fresh request. Errors
+        propagate to every waiter.
+        """
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = asyncio.create_task(factory())
+            self._inflight[key] = flight
+            flight.add_done_callback(lambda _t, _k=key: self._inflight.pop(_k, None))
+
+        return await flight
+
+    async def get_or_create(self, key: str, factory: Callable):
+        """Get a cached value, coalescing concurrent misses onto one call."""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        flight = self._inflight.get(key)
+        created = flight is None
+        if created:
+            flight = asyncio.create_task(factory())
+            self._inflight[key] = flight
+            flight.add_done_callback(lambda _t, _k=key: self._inflight.pop(_k, None))
+
+        value = await flight
+        if created:
+            self.put(key, value)
+        return value
+
+class BatchProcessor:
+    """Coalesces non-interactive requests into grouped dispatches.
+
+    Batch-class requests go onto a queue that a drain task empties in
+    micro-batches: once a request arrives, the drainer keeps collecting
+    until the queue stays quiet for ``window`` seconds or the batch is
+    full, then dispatches the whole group at once. A coordinator fan-out
+    that submits many prompts in the same tick therefore leaves as one
+    group instead of N separate round-trips, and the dispatch step is the
+    single place to target a provider batch endpoint (e.g. Anthropic
+    Message Batches) for discounted pricing.
+    """
+
+    def __init__(
+        self,
+        manager: "AIProviderManager",
+        max_batch_size: int = 20,
+        window: float = 0.05
+    ):
+        self.manager = manager
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
+
+    async def submit(
+        self,
+        provider_name: str,
+        messages: List[Message],
+        **kwargs
+    ) -> AIResponse:
+        """Enqueue a request and wait for its batched response."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((provider_name, messages, kwargs, future))
+
+        # Started lazily so the global manager can be built without a loop
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+
+        return await future
+
+    async def _drain(self):
+        """Collect quiet-period micro-batches off the queue and dispatch them."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=self.window)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            await self._dispatch(batch)
+
+            if self._queue.empty():
+                break
+
+    async def _dispatch(self, batch: List[tuple]):
+        logger.info(f"Dispatching batch of {len(batch)} requests")
+
+        async def dispatch(provider_name, messages, kwargs, future):
+            try:
+                response = await self.manager.generate_response(
+                    provider_name, messages, **kwargs
+                )
+                future.set_result(response)
+            except Exception as e:
+                future.set_exception(e)
+
+        await asyncio.gather(*(dispatch(*entry) for entry in batch))
+
 class AIProviderManager:
     """Manages multiple AI providers."""
 
@@ -332,6 +539,8 @@ class AIProviderManager:
         self.config = get_config()
         self.providers: Dict[str, BaseAIProvider] = {}
         self._initialize_providers()
+        self.batch_processor = BatchProcessor(self)
+        self.response_cache = AsyncLRUCache(maxsize=4096)
 
     def _initialize_providers(self):
         """Initialize all configured AI providers."""
@@ -361,12 +570,55 @@ class AIProviderManager:
         messages: List[Message],
         **kwargs
     ) -> AIResponse:
-        """Generate response from a specific provider."""
+        """Generate response from a specific provider.
+
+        Deterministic requests (effective temperature of 0, or an explicit
+        ``cache=True`` override) are served from an in-memory LRU cache, and
+        identical in-flight requests are coalesced onto a single call.
+        Sampling requests are never cached, but concurrent identical ones
+        still share one in-flight call.
+        """
         provider = self.get_provider(provider_name)
         if not provider:
             raise ValueError(f"Provider {provider_name} not found")
 
-        return await provider.generate_response(messages, **kwargs)
+        cache = kwargs.pop("cache", None)
+        temperature = kwargs.get("temperature", provider.config.temperature)
+        key = self._response_cache_key(provider_name, temperature, messages)
+
+        if cache is False or (cache is not True and temperature > 0):
+            # Not cacheable, but a coordinator fanning the same prompt out
+            # to several agents still shares one in-flight request
+            return await self.response_cache.coalesce(
+                key, lambda: provider.generate_response(messages, **kwargs)
+            )
+
+        return await self.response_cache.get_or_create(
+            key, lambda: provider.generate_response(messages, **kwargs)
+        )
+
+    @staticmethod
+    def _response_cache_key(
+        provider_name: str,
+        temperature: float,
+        messages: List[Message]
+    ) -> str:
+        """Build a cache key from the provider, temperature, and messages."""
+        normalized = json.dumps(
+            [(m.role, m.content) for m in messages],
+            separators=(",", ":")
+        )
+        digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{provider_name}:{temperature}:{digest}"
+
+    async def generate_batch_response(
+        self,
+        provider_name: str,
+        messages: List[Message],
+        **kwargs
+    ) -> AIResponse:
+        """Generate a response via the coalescing batch path."""
+        return await self.batch_processor.submit(provider_name, messages, **kwargs)
 
     async def generate_stream(
         self,
@@ -12,7 +12,7 @@ from dataclasses import dataclass, asdict
 
 from .agent import BaseAgent, AgentTask, get_coordinator
 from .config import get_config
-from ..agents.builder_agents import create_builder_team
+from ..agents.builder_agents import consult_all, create_builder_team, get_plan_cache
 
 logger = logging.getLogger(__name__)
 
@@ -196,9 +196,11 @@ Be conversational and ask one question at a time to help me think through this s
             response = await agent.think(user_input)
             agent_name = relevant_agents[0]
         else:
-            # Multiple agent coordination
-            coordinated_results = await self.coordinator.coordinate_task(
-                user_input, relevant_agents
+            # Multiple agent coordination: fan out concurrently
+            coordinated_results = await consult_all(
+                [self.agents[name] for name in relevant_agents],
+                user_input,
+                context={"coordinator": self.coordinator.name, "original_task": user_input}
             )
 
             # Combine responses
@@ -280,25 +282,52 @@ Be conversational and ask one question at a time to help me think through this s
 
         session = self.sessions[session_id]
 
-        # Get final analysis from all agents
-        spec_tasks = {}
-        for agent_name, agent in self.agents.items():
-            task = AgentTask(
-                description=f"Generate final specification for {session.project.name}",
-                context={
+        # Build the full advisory plan up front
+        project_dict = asdict(session.project)
+        plan_contexts = {
+            agent_name: {
+                "description": f"Generate final specification for {session.project.name}",
+                "context": {
                     "session_messages": session.messages,
-                    "project": asdict(session.project),
+                    "project": project_dict,
                     "agent_role": agent.role
                 }
-            )
+            }
+            for agent_name, agent in self.agents.items()
+        }
 
-            await agent.assign_task(task)
-            spec_tasks[agent_name] = task
+        plan_cache = get_plan_cache()
+        fingerprint = plan_cache.fingerprint(project_dict)
+
+        # An exact repeat of a recorded run returns its memoized results
+        agent_results = plan_cache.get_results(fingerprint, plan_contexts)
+        if agent_results is None:
+            # First run for this plan: dispatch through the task queues
+            spec_tasks = {}
+            for agent_name, agent in self.agents.items():
+                task = AgentTask(
+                    description=plan_contexts[agent_name]["description"],
+                    context=plan_contexts[agent_name]["context"]
+                )
+
+                await agent.assign_task(task)
+                spec_tasks[agent_name] = task
+
+            # Wait for all tasks to complete
+            await asyncio.gather(*[
+                task.done.wait() for task in spec_tasks.values()
+            ])
+
+            agent_results = {
+                agent_name: task.result
+                for agent_name, task in spec_tasks.items()
+                if task.result
+            }
 
-        # Wait for all tasks to complete
-        for agent_name, task in spec_tasks.items():
-            while task.status not in ["completed", "error"]:
-                await asyncio.sleep(0.1)
+            # Memoize only complete runs: recording a run with errored
+            # agents would pin the partial result into every exact retry
+            if len(agent_results) == len(spec_tasks):
+                plan_cache.record(fingerprint, plan_contexts, agent_results)
 
         # Combine specifications
         specification = {
@@ -309,13 +338,9 @@ Be conversational and ask one question at a time to help me think through this s
                 "duration": (datetime.now() - session.created_at).total_seconds(),
                 "status": session.status
             },
-            "agent_specifications": {}
+            "agent_specifications": agent_results
         }
 
-        for agent_name, task in spec_tasks.items():
-            if task.result:
-                specification["agent_specifications"][agent_name] = task.result
-
         # Add final coordination summary
         coordinator_summary = await self.coordinator.think(
             f"Please provide a final summary and integration plan for this project specification: {session.project.name}"
@@ -4,6 +4,7 @@ Manages all configuration settings for the Builder Team system.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from pydantic import BaseSettings, Field
@@ -190,8 +191,9 @@ def get_project_root() -> Path:
     """Get the project root directory."""
     return Path(__file__).parent.parent.parent
 
+@lru_cache(maxsize=1)
 def ensure_directories():
-    """Ensure all required directories exist."""
+    """Ensure all required directories exist (runs once per process)."""
     directories = [
         "logs",
         "data",
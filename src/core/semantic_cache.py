@@ -0,0 +1,213 @@
+"""
+AI Crew Builder Team - Semantic Response Cache
+Caches advisory responses keyed on (agent, task type, canonical context).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Bound once so per-call overhead is a single positional call
+_canonical_dumps = partial(json.dumps, sort_keys=True, separators=(",", ":"), default=str)
+
+if orjson is not None:
+    # OPT_NON_STR_KEYS matches the stdlib fallback, which coerces
+    # non-string dict keys instead of raising
+    _ORJSON_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def canonical_json(obj: Any) -> str:
+        """Serialize to a deterministic, minimal JSON form for cache keys."""
+        return orjson.dumps(obj, option=_ORJSON_OPTS, default=str).decode()
+else:
+    def canonical_json(obj: Any) -> str:
+        """Serialize to a deterministic, minimal JSON form for cache keys."""
+        return _canonical_dumps(obj)
+
+class SemanticCache:
+    """LRU cache for LLM responses keyed on canonicalized request content.
+
+    The advisory agents are stateless wrappers around the model, so an
+    identical (agent, task type, context) triple produces the same answer —
+    a hit here skips the entire LLM round-trip. Keys are exact content
+    hashes; a similarity index could be slotted in behind the same
+    get/put API if fuzzy matching is ever needed.
+
+    With a ``persist_path``, entries are mirrored to a sqlite database so
+    cached answers survive process restarts — the in-memory LRU stays the
+    hot layer and the database is consulted only on memory misses.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        persist_path: Optional[Union[str, Path]] = None,
+        max_persisted: int = 2048,
+        max_age: float = 7 * 86400
+    ):
+        self.max_entries = max_entries
+        self.max_persisted = max_persisted
+        self.max_age = max_age
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        # Writes run in worker threads (see put), so the connection is
+        # shared across threads and every DB access holds this lock
+        self._db_lock = threading.Lock()
+        self._pending_writes: set = set()
+
+        self._db: Optional[sqlite3.Connection] = None
+        if persist_path is not None:
+            try:
+                path = Path(persist_path).expanduser()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(str(path), check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS responses "
+                    "(key TEXT PRIMARY KEY, response TEXT, ts REAL)"
+                )
+                self._db.commit()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Semantic cache persistence disabled: {e}")
+                self._db = None
+
+    @staticmethod
+    def make_key(agent_name: str, task_type: str, payload: Any, model: str = "") -> str:
+        """Build a cache key from the agent, task type, and context payload."""
+        return SemanticCache.make_key_from_json(
+            agent_name, task_type, canonical_json(payload), model
+        )
+
+    @staticmethod
+    def make_key_from_json(
+        agent_name: str,
+        task_type: str,
+        payload_json: str,
+        model: str = ""
+    ) -> str:
+        """Build a cache key from an already-canonicalized payload string.
+
+        ``model`` scopes the key to the active provider/model, so answers
+        persisted before a provider or model switch are never served
+        after it.
+        """
+        digest = hashlib.sha256(payload_json.encode("utf-8")).hexdigest()
+        return f"{agent_name}:{task_type}:{model}:{digest}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss."""
+        response = self._entries.get(key)
+        if response is None and self._db is not None:
+            response = self._get_persisted(key)
+            if response is not None:
+                # Promote disk hits into the hot layer
+                self._put_memory(key, response)
+
+        if response is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        logger.debug(f"Semantic cache hit: {key}")
+        return response
+
+    def put(self, key: str, response: str):
+        """Store a response, evicting the least recently used entry if full."""
+        self._put_memory(key, response)
+
+        if self._db is None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._persist(key, response)
+            return
+
+        # Persist in a worker thread: the sqlite write and commit would
+        # otherwise block the event loop on the advisory hot path. Keep a
+        # reference so the task isn't garbage-collected mid-write
+        task = loop.create_task(asyncio.to_thread(self._persist, key, response))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+
+    def _persist(self, key: str, response: str):
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+                    (key, response, time.time())
+                )
+                self._db.execute(
+                    "DELETE FROM responses WHERE key NOT IN "
+                    "(SELECT key FROM responses ORDER BY ts DESC LIMIT ?)",
+                    (self.max_persisted,)
+                )
+                self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to persist cache entry: {e}")
+
+    def _put_memory(self, key: str, response: str):
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _get_persisted(self, key: str) -> Optional[str]:
+        try:
+            with self._db_lock:
+                # Age-bounded: entries older than max_age are stale, not hits
+                row = self._db.execute(
+                    "SELECT response FROM responses WHERE key = ? AND ts > ?",
+                    (key, time.time() - self.max_age)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read persisted cache entry: {e}")
+            return None
+        return row[0] if row else None
+
+    def clear(self):
+        """Drop all cached responses, including persisted ones."""
+        self._entries.clear()
+        if self._db is not None:
+            try:
+                with self._db_lock:
+                    self._db.execute("DELETE FROM responses")
+                    self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to clear persisted cache: {e}")
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+# Global cache instance shared by all advisory agents, persisted under the
+# same cache root the setup scripts use
+response_cache = SemanticCache(
+    persist_path=Path.home() / ".cache" / "buildercrew" / "advisory_cache.db"
+)
+
+def get_response_cache() -> SemanticCache:
+    """Get the global response cache instance."""
+    return response_cache